@@ -3,27 +3,35 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 import matplotlib.ticker as mticker
 from data_loader import DataLoader
+from issue_query import IssueQuery
+import plotting
+import profiling
 
 class Analysis:
     def _init_(self):
         """Initialize the Analysis class"""
         pass
 
-    def filter_issues(self, df, label=None, creator=None):
-        """Filter issues based on a specified label or creator."""
-        # Explode 'labels' column if it is a list, to handle multiple labels per issue
-        if 'labels' in df.columns and df['labels'].apply(lambda x: isinstance(x, list)).any():
-            df = df.explode('labels')
-
-        filtered_df = df
-        if label:
-            filtered_df = filtered_df[filtered_df['labels'] == label]
-        if creator:
-            filtered_df = filtered_df[filtered_df['creator'] == creator]
+    @profiling.timed('filter_issues')
+    def filter_issues(self, df, label=None, creator=None, label_index=None, state=None,
+                      since=None, until=None, closed_by=None, query=None):
+        """Filter issues based on a specified label, creator, state, closer or creation date range.
+
+        The predicates are evaluated with an IssueQuery on the un-exploded issues,
+        using label_index (a LabelIndex built over df) when given, and only the
+        matching issues are exploded. A prebuilt query over df, e.g. from
+        IssueStore.query(), can be passed to reuse its indexes.
+        """
+        if query is None:
+            query = IssueQuery(df, label_index)
+        query = (query.label(label).creator(creator).state(state)
+                 .closed_by(closed_by).between(since, until))
+        filtered_df = query.explode()
 
         print(f"Filtered {len(filtered_df)} issues for label '{label}' and creator '{creator}'")
         return filtered_df
         
+    @profiling.timed('user_label_analysis')
     def analyze_and_visualize(self, filtered_df, df):
         """Perform analysis and create visualizations for filtered issues."""
         if filtered_df.empty:
@@ -63,6 +71,13 @@ class Analysis:
             print("No data available for opened/closed issues by user and label. Plotting skipped.")
             return
 
+        self.visualize(user_label_issue_counts, user_label_counts, filtered_df['creator'].iloc[0])
+
+    def visualize(self, user_label_issue_counts, user_label_counts, creator, name_suffix=''):
+        """Plot the opened vs closed issues per user and label and the labels used by creator.
+
+        name_suffix is appended to the figure names, to tell the reports of several users apart.
+        """
         # Plotting opened vs closed issues per user and label
         ax = user_label_issue_counts.plot(kind='bar', stacked=False, figsize=(14, 8), color=['skyblue', 'salmon'])
         plt.title('Number of Issues Opened and Closed by User and Label')
@@ -77,25 +92,75 @@ class Analysis:
         # Ensure the y-axis only shows integer values
         ax.yaxis.set_major_locator(mticker.MaxNLocator(integer=True))
 
-        plt.show()
+        plotting.show('user_label_opened_closed' + name_suffix)
 
         # Now, to visualize the labels used by that particular user
-        # Filter only for the creator user and calculate the frequency of each label for that user
-        user_label_counts = filtered_df.groupby('labels').size().sort_values(ascending=False)
-
         if user_label_counts.empty:
-            print(f"No labels found for user '{filtered_df['creator'].iloc[0]}'.")
+            print(f"No labels found for user '{creator}'.")
             return
 
         # Plotting labels used by the user
         plt.figure(figsize=(14, 8))
         user_label_counts.plot(kind='bar', color='lightcoral')
-        plt.title(f'Labels Used by {filtered_df["creator"].iloc[0]}')
+        plt.title(f'Labels Used by {creator}')
         plt.xlabel('Labels')
         plt.ylabel('Frequency')
         plt.xticks(rotation=45, ha='right')
         plt.tight_layout()
-        plt.show()
+        plotting.show('user_label_frequency' + name_suffix)
+
+    @profiling.timed('user_label_aggregates')
+    def aggregate_by_user_label(self, df, users=None, labels=None, label_index=None, query=None):
+        """Count the opened and closed issues per (creator, label) in one groupby.
+
+        Only the issues of users carrying one of labels are exploded (all issues if
+        either is None). Besides opened_count and closed_count, days_to_close sums the
+        days to close of the closed issues, so that averages can be taken per user.
+        Issues without labels are kept with a missing label.
+        """
+        if query is None:
+            query = IssueQuery(df, label_index)
+        exploded = query.label(labels).creator(users).explode()
+        closed = exploded['closed_at'].notna()
+        days_to_close = (exploded['closed_at'] - exploded['created_at']).dt.days
+        counts = pd.DataFrame({
+            'creator': exploded['creator'],
+            'labels': exploded['labels'],
+            'opened_count': 1,
+            'closed_count': closed.astype(int),
+            'days_to_close': days_to_close.where(closed, 0),
+        })
+        return counts.groupby(['creator', 'labels'], dropna=False, observed=True).sum()
+
+    @profiling.timed('user_label_batch')
+    def analyze_users(self, df, users, labels=None, label_index=None, query=None):
+        """Report on each of several users from one aggregation over the dataset.
+
+        Every user gets the output and figures of analyze_and_visualize for the
+        issues they opened (with one of labels, if given).
+        """
+        counts = self.aggregate_by_user_label(df, users, labels, label_index, query)
+        creators = counts.index.get_level_values('creator')
+        for user in users:
+            print(f"\n===== User {user} =====\n")
+            user_counts = counts[creators == user]
+            if user_counts.empty:
+                print("No issues found for the specified label and/or creator. Analysis and visualization skipped.")
+                continue
+
+            closed_count = user_counts['closed_count'].sum()
+            if closed_count == 0:
+                print("No closed issues found. Average time to close cannot be calculated.")
+            else:
+                print(f"Average time to close (days): {user_counts['days_to_close'].sum() / closed_count:.2f}")
+
+            labelled = user_counts[user_counts.index.get_level_values('labels').notna()]
+            user_label_counts = labelled['opened_count'].droplevel('creator').sort_values(ascending=False)
+            print(f"Unique labels used by {user}: {user_label_counts.index.tolist()}")
+            if user_label_counts.empty:
+                print(f"No labels found for user '{user}'.")
+                continue
+            self.visualize(labelled[['opened_count', 'closed_count']], user_label_counts, user, f'_{user}')
 
 
 
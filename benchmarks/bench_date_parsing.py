@@ -0,0 +1,68 @@
+"""
+Micro-benchmark of model.parse_date against dateutil's parser on event
+timestamps. The timestamps are read from the configured issues file when
+it is available and generated in GitHub's format otherwise.
+
+Run from the root directory of the application:
+
+    python benchmarks/bench_date_parsing.py
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from dateutil import parser
+from model import parse_date
+from data_loader import DataLoader
+
+
+def load_timestamps(limit):
+    """
+    Returns up to limit event timestamps from the configured issues file.
+    """
+    try:
+        loader = DataLoader()
+        timestamps = []
+        for issue in loader.iter_issues():
+            timestamps.extend(event['event_date'] for event in issue.get('events', []) if event.get('event_date'))
+            if len(timestamps) >= limit:
+                break
+        return timestamps[:limit]
+    except (OSError, KeyError, ValueError):
+        return []
+
+
+def synthetic_timestamps(count):
+    return [f'20{20 + i % 5}-{1 + i % 12:02d}-{1 + i % 28:02d}T{i % 24:02d}:{i % 60:02d}:{(7 * i) % 60:02d}+00:00'
+            for i in range(count)]
+
+
+def main():
+    ap = argparse.ArgumentParser("bench_date_parsing.py")
+    ap.add_argument('--count', type=int, default=100000, help='Number of timestamps to parse')
+    args = ap.parse_args()
+
+    timestamps = load_timestamps(args.count)
+    source = 'configured issues file'
+    if not timestamps:
+        timestamps = synthetic_timestamps(args.count)
+        source = 'synthetic GitHub timestamps'
+
+    # Both paths must agree on every timestamp before timing them
+    assert all(parse_date(ts) == parser.parse(ts) for ts in timestamps)
+
+    dateutil_time = min(timeit.repeat(lambda: [parser.parse(ts) for ts in timestamps], number=1, repeat=3))
+    fast_time = min(timeit.repeat(lambda: [parse_date(ts) for ts in timestamps], number=1, repeat=3))
+
+    print(f'{len(timestamps)} timestamps from the {source}')
+    print(f'  dateutil.parser.parse: {dateutil_time:.3f}s ({dateutil_time / len(timestamps) * 1e6:.2f}us each)')
+    print(f'  model.parse_date:      {fast_time:.3f}s ({fast_time / len(timestamps) * 1e6:.2f}us each)')
+    print(f'  speedup: {dateutil_time / fast_time:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
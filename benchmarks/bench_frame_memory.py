@@ -0,0 +1,51 @@
+"""
+Compares the memory used by the processed issues DataFrame with the default
+dtypes and with data_loader.optimize_dtypes, reported in bytes per issue and
+per column.
+
+Run from the root directory of the application:
+
+    python benchmarks/bench_frame_memory.py --issues 100000
+"""
+
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from data_loader import DataLoader, optimize_dtypes
+from synthetic import make_issues
+
+
+def column_bytes(df):
+    """
+    Returns the bytes used by each column. pandas only counts the list objects
+    of the labels column, so the label strings are added once per distinct object.
+    """
+    usage = df.memory_usage(deep=True, index=False)
+    label_strings = {id(label): label for labels in df['labels'] for label in labels}
+    usage['labels'] += sum(sys.getsizeof(label) for label in label_strings.values())
+    return usage
+
+
+def main():
+    ap = argparse.ArgumentParser("bench_frame_memory.py")
+    ap.add_argument('--issues', type=int, default=100000, help='Number of synthetic issues')
+    args = ap.parse_args()
+
+    # Round-trip through JSON so that, as when reading a file, every label is its own string object
+    issues = json.loads(json.dumps(make_issues(args.issues)))
+    df = DataLoader(file_path='unused.json').process_issues(issues)
+    default_usage = column_bytes(df)
+    optimized_usage = column_bytes(optimize_dtypes(df))
+
+    print(f'{"column":<12}{"default":>12}{"optimized":>12}  (bytes per issue)')
+    for column in default_usage.index:
+        print(f'{column:<12}{default_usage[column] / len(df):>12.1f}{optimized_usage[column] / len(df):>12.1f}')
+    print(f'{"total":<12}{default_usage.sum() / len(df):>12.1f}{optimized_usage.sum() / len(df):>12.1f}')
+
+
+if __name__ == '__main__':
+    main()
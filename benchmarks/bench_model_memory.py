@@ -0,0 +1,56 @@
+"""
+Measures the memory held by model.Issue objects built from synthetic
+poetry-like issues, reported per 100k issues.
+
+Run from the root directory of the application:
+
+    python benchmarks/bench_model_memory.py --issues 100000
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from model import Issue
+from synthetic import make_issues
+
+
+def measure(issues, touch_events):
+    """
+    Returns the bytes allocated and seconds spent building Issue objects,
+    optionally accessing every issue's events afterwards.
+    """
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    models = [Issue(issue) for issue in issues]
+    event_count = sum(len(model.events) for model in models)
+    if touch_events:
+        event_count = sum(1 for model in models for _ in model.events)
+    elapsed = time.perf_counter() - start
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del models
+    return allocated, elapsed, event_count
+
+
+def main():
+    ap = argparse.ArgumentParser("bench_model_memory.py")
+    ap.add_argument('--issues', type=int, default=100000, help='Number of synthetic issues')
+    args = ap.parse_args()
+
+    issues = make_issues(args.issues)
+    scale = 100000 / args.issues
+    for touch_events, name in [(False, 'counting events only'), (True, 'iterating all events')]:
+        allocated, elapsed, event_count = measure(issues, touch_events)
+        print(f'{name}: {allocated * scale / 2 ** 20:.1f} MiB per 100k issues, '
+              f'{elapsed:.2f}s ({event_count} events)')
+
+
+if __name__ == '__main__':
+    main()
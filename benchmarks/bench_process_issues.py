@@ -0,0 +1,51 @@
+"""
+Benchmarks the column-wise DataLoader.process_issues against the
+row-wise reference implementation on synthetic poetry-like issues.
+
+Run from the root directory of the application:
+
+    python benchmarks/bench_process_issues.py --issues 100000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pandas as pd
+from data_loader import DataLoader
+from synthetic import make_issues
+
+
+def best_of(repeat, func, *args):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def main():
+    ap = argparse.ArgumentParser("bench_process_issues.py")
+    ap.add_argument('--issues', type=int, default=100000, help='Number of synthetic issues')
+    ap.add_argument('--repeat', type=int, default=3, help='Number of timed repetitions')
+    args = ap.parse_args()
+
+    issues = make_issues(args.issues)
+    loader = DataLoader.__new__(DataLoader)
+
+    rowwise_time, rowwise_df = best_of(args.repeat, loader.process_issues_rowwise, issues)
+    columnar_time, columnar_df = best_of(args.repeat, loader.process_issues, issues)
+    pd.testing.assert_frame_equal(columnar_df, rowwise_df)
+
+    print(f'{args.issues} issues')
+    print(f'  row-wise process_issues:    {rowwise_time:.3f}s')
+    print(f'  column-wise process_issues: {columnar_time:.3f}s')
+    print(f'  speedup: {rowwise_time / columnar_time:.2f}x')
+
+
+if __name__ == '__main__':
+    main()
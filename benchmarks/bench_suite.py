@@ -0,0 +1,149 @@
+"""
+Times the main stages of the pipeline on synthetic poetry-like issues at
+several dataset sizes: DataLoader.process_events and process_issues, the label index,
+Analysis.filter_issues, analyze_and_visualize for one user, every *Analysis.run and
+building model.Issue objects. Plotting is stubbed out so that only the
+analyses' own work and figure construction are measured.
+
+The results are written as JSON and compared with a stored baseline; a
+stage more than --threshold times slower than its baseline is reported as
+a regression. Run from the root directory of the application:
+
+    python benchmarks/bench_suite.py --sizes 1000,10000,100000,1000000
+    python benchmarks/bench_suite.py --sizes 1000,10000 --save-baseline
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import time
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+from analysis import Analysis
+from data_loader import DataLoader
+from issue_close_time_analysis import IssueCloseTimeAnalysis
+from label_index import LabelIndex
+from model import Issue
+from month_issue_analysis import MonthIssueAnalysis
+from overall_analysis import OverallAnalysis
+import synthetic
+
+DEFAULT_SIZES = '1000,10000,100000,1000000'
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), 'baseline.json')
+
+
+def best_of(repeat, func, *args):
+    """
+    Returns the fastest of repeat timed calls and the result of the last one.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def stub_show(name):
+    plt.close('all')
+
+
+def run_size(count, args):
+    """
+    Times every stage on count synthetic issues and returns {stage: seconds}.
+    """
+    issues = synthetic.make_issues(count, args.seed, args.events_per_issue, args.labels, args.closed_fraction)
+    label = synthetic.make_labels(args.labels)[0]
+    loader = DataLoader(file_path='synthetic.json')
+    analysis = Analysis()
+    timings = {}
+
+    # The analyses print a lot and would otherwise show or save their figures
+    with patch('plotting.show', stub_show), contextlib.redirect_stdout(io.StringIO()):
+        timings['model_parsing'], _ = best_of(args.repeat, lambda: [Issue(issue) for issue in issues])
+        timings['process_events'], events_df = best_of(args.repeat, loader.process_events, issues)
+        # As when loading, the issues are processed with their already built events table
+        timings['process_issues'], df = best_of(args.repeat, loader.process_issues, issues, events_df)
+        timings['label_index'], label_index = best_of(args.repeat, LabelIndex.from_issues, df)
+        timings['filter_issues'], _ = best_of(
+            args.repeat, lambda: analysis.filter_issues(df, label=label, label_index=label_index))
+        # Feature 1 for a single user, whose figures stay readable at every size
+        user_df = analysis.filter_issues(df, creator=df['creator'].iloc[0])
+        timings['analyze_and_visualize'], _ = best_of(args.repeat, analysis.analyze_and_visualize, user_df, df)
+        timings['overall_analysis'], _ = best_of(args.repeat, OverallAnalysis().run, df)
+        timings['month_issue_analysis'], _ = best_of(args.repeat, MonthIssueAnalysis().run, df)
+        timings['close_time_analysis'], _ = best_of(args.repeat, IssueCloseTimeAnalysis().run, df, label_index)
+    return timings
+
+
+def compare(results, baseline, threshold):
+    """
+    Prints every timing next to its baseline and returns the regressed stages.
+    """
+    regressions = []
+    for size, timings in results.items():
+        print(f'\n{size} issues')
+        for stage, seconds in timings.items():
+            reference = baseline.get(size, {}).get(stage)
+            if reference:
+                ratio = seconds / reference
+                flag = '  REGRESSION' if ratio > threshold else ''
+                print(f'  {stage:<24}{seconds:>10.4f}s  baseline {reference:>8.4f}s  {ratio:>5.2f}x{flag}')
+                if flag:
+                    regressions.append((size, stage))
+            else:
+                print(f'  {stage:<24}{seconds:>10.4f}s')
+    return regressions
+
+
+def main():
+    ap = argparse.ArgumentParser("bench_suite.py")
+    ap.add_argument('--sizes', type=str, default=DEFAULT_SIZES, help='Comma separated numbers of issues')
+    ap.add_argument('--repeat', type=int, default=3, help='Number of timed repetitions per stage')
+    synthetic.add_arguments(ap)
+    ap.add_argument('--output', type=str, required=False, help='Path to write the results as JSON')
+    ap.add_argument('--baseline', type=str, default=BASELINE_PATH, help='Baseline results to compare against')
+    ap.add_argument('--save-baseline', action='store_true', help='Store the results as the new baseline')
+    ap.add_argument('--threshold', type=float, default=1.25,
+                    help='Slowdown relative to the baseline reported as a regression')
+    args = ap.parse_args()
+
+    results = {}
+    for count in [int(size) for size in args.sizes.split(',')]:
+        results[str(count)] = run_size(count, args)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)['results']
+    regressions = compare(results, baseline, args.threshold)
+
+    report = {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'generator': {'events_per_issue': args.events_per_issue, 'labels': args.labels,
+                      'closed_fraction': args.closed_fraction, 'seed': args.seed},
+        'results': results,
+    }
+    for path in [args.output, args.baseline if args.save_baseline else None]:
+        if path:
+            with open(path, 'w') as f:
+                json.dump(report, f, indent=2)
+            print(f'\nSaved results to {path}')
+
+    if regressions and not args.save_baseline:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
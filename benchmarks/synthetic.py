@@ -0,0 +1,92 @@
+"""
+Generates synthetic issues shaped like the poetry issues dump, for the
+benchmarks. The number of issues, the average number of events per issue,
+the number of distinct labels and the fraction of closed issues can be set.
+
+Run from the root directory of the application to write a data file that
+run.py can be pointed at (a .jsonl path writes JSON Lines):
+
+    python benchmarks/synthetic.py --issues 100000 --output synthetic_issues.json
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from data_loader import write_json_lines
+
+LABELS = ['kind/bug', 'kind/feature', 'area/docs', 'status/triage', 'area/installer', 'area/solver']
+EVENT_TYPES = ['labeled', 'commented', 'mentioned', 'subscribed', 'referenced']
+
+
+def make_labels(label_count):
+    """
+    Returns label_count distinct label names, starting with poetry's most common ones.
+    """
+    return LABELS[:label_count] + [f'area/component{i}' for i in range(len(LABELS), label_count)]
+
+
+def make_issues(count, seed=0, events_per_issue=2.5, label_count=len(LABELS), closed_fraction=0.7):
+    """
+    Generates count synthetic issues. Every issue has on average events_per_issue
+    events besides its closing event, and up to two labels out of label_count.
+    """
+    rng = random.Random(seed)
+    labels = make_labels(label_count)
+    max_events = int(2 * events_per_issue) + 1
+    issues = []
+    for number in range(1, count + 1):
+        closed = rng.random() < closed_fraction
+        events = [{'event_type': rng.choice(EVENT_TYPES),
+                   'author': f'user{rng.randrange(500)}',
+                   'event_date': f'2023-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T10:00:00+00:00'}
+                  for _ in range(rng.randrange(max_events))]
+        if closed:
+            events.append({'event_type': 'closed', 'author': f'Maintainer{rng.randrange(20)} ',
+                           'event_date': '2024-01-15T10:00:00+00:00'})
+        issues.append({
+            'url': f'https://github.com/python-poetry/poetry/issues/{number}',
+            'creator': f'user{rng.randrange(5000)}',
+            'labels': rng.sample(labels, min(rng.randrange(3), len(labels))),
+            'state': 'closed' if closed else 'open',
+            'title': f' Issue number {number} ',
+            'number': number,
+            'created_date': f'2023-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T09:00:00+00:00',
+            'updated_date': '2024-02-01T10:00:00+00:00',
+            'events': events,
+        })
+    return issues
+
+
+def add_arguments(ap):
+    """
+    Adds the generator's options to an argument parser.
+    """
+    ap.add_argument('--events-per-issue', type=float, default=2.5, help='Average number of events per issue')
+    ap.add_argument('--labels', type=int, default=len(LABELS), help='Number of distinct labels')
+    ap.add_argument('--closed-fraction', type=float, default=0.7, help='Fraction of closed issues')
+    ap.add_argument('--seed', type=int, default=0, help='Random seed')
+
+
+def main():
+    ap = argparse.ArgumentParser("synthetic.py")
+    ap.add_argument('--issues', type=int, default=10000, help='Number of synthetic issues')
+    ap.add_argument('--output', type=str, required=True, help='Path of the JSON or JSON Lines file to write')
+    add_arguments(ap)
+    args = ap.parse_args()
+
+    issues = make_issues(args.issues, args.seed, args.events_per_issue, args.labels, args.closed_fraction)
+    if '.jsonl' in args.output:
+        write_json_lines(issues, args.output)
+    else:
+        with open(args.output, 'w') as f:
+            json.dump(issues, f)
+    print(f'Wrote {len(issues)} issues to {args.output}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,9 +1,269 @@
+import bz2
+import glob
+import gzip
+import hashlib
+import io
 import json
+import lzma
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+import numpy as np
 import pandas as pd
+import config
+import profiling
+from event_stats import CLOSED_EVENT, REOPENED_EVENT, events_frame, parse_event_dates, resolve_closing_events
+from issue_query import to_timestamp
+from model import parse_date
+
+# Number of characters read from the source file at a time when streaming
+STREAM_BUFFER_SIZE = 1 << 16
+
+# Bump whenever process_issues changes its output so that stale caches are ignored
+CACHE_VERSION = 4
+# Number of bytes hashed at the start and at the end of the source file for the cache key
+CACHE_HASH_BLOCK_SIZE = 1 << 20
+
+# Strip and lowercase a text value the same way as Series.str.strip().str.lower(),
+# optionally memoising the result for columns with few distinct values
+def normalize_text(value, cache=None):
+    if not isinstance(value, str):
+        return None
+    if cache is None:
+        return value.strip().lower()
+    normalized = cache.get(value)
+    if normalized is None:
+        normalized = cache[value] = value.strip().lower()
+    return normalized
+
+
+# Load the issues of one repository in a worker process for DataLoader.load_and_process_repos
+def _load_repo(repo, file_path, chunk_size, cache_dir, incremental, since, until):
+    loader = DataLoader(file_path=file_path, chunk_size=chunk_size, cache_dir=cache_dir, incremental=incremental,
+                        since=since, until=until)
+    df = loader.load_processed_issues()
+    df['repo'] = repo
+    events_df = loader.events_df
+    events_df['repo'] = repo
+    return df, events_df
+
+
+# Leading bytes identifying compressed files, checked before falling back to the file extension
+COMPRESSION_MAGIC = [
+    (b'\x1f\x8b', 'gzip'),
+    (b'\xfd7zXZ\x00', 'xz'),
+    (b'BZh', 'bz2'),
+    (b'\x28\xb5\x2f\xfd', 'zstd'),
+]
+COMPRESSION_EXTENSIONS = {'.gz': 'gzip', '.xz': 'xz', '.bz2': 'bz2', '.zst': 'zstd'}
+
+
+# Detect how a data file is compressed from its magic bytes or its extension; None if it is not
+def detect_compression(file_path):
+    with open(file_path, 'rb') as f:
+        head = f.read(8)
+    for magic, compression in COMPRESSION_MAGIC:
+        if head.startswith(magic):
+            return compression
+    return COMPRESSION_EXTENSIONS.get(os.path.splitext(file_path)[1].lower())
+
+
+# Open a data file as text, decompressing it on the fly so that it never has to be
+# decompressed to disk first. zstd support needs the optional zstandard package.
+def open_source(file_path):
+    compression = detect_compression(file_path)
+    if compression is None:
+        return open(file_path, 'r')
+    if compression == 'gzip':
+        return gzip.open(file_path, 'rt', encoding='utf-8')
+    if compression == 'xz':
+        return lzma.open(file_path, 'rt', encoding='utf-8')
+    if compression == 'bz2':
+        return bz2.open(file_path, 'rt', encoding='utf-8')
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError(f"Reading {file_path} requires the zstandard package: pip install zstandard")
+    raw = open(file_path, 'rb')
+    return io.TextIOWrapper(zstandard.ZstdDecompressor().stream_reader(raw, closefd=True), encoding='utf-8')
+
+
+# Extensions of files holding one JSON issue per line instead of a single JSON array
+JSON_LINES_EXTENSIONS = ('.jsonl', '.ndjson')
+# Uncompressed JSON Lines files at least this large are parsed by several processes
+JSON_LINES_PARALLEL_MIN_BYTES = 32 << 20
+
+
+# Check whether a data file holds JSON Lines, from its extension (ignoring any
+# compression extension) or else from its first non-whitespace character
+def is_json_lines(file_path):
+    stem, extension = os.path.splitext(file_path)
+    if extension.lower() in COMPRESSION_EXTENSIONS:
+        extension = os.path.splitext(stem)[1]
+    if extension.lower() in JSON_LINES_EXTENSIONS:
+        return True
+    with open_source(file_path) as f:
+        head = f.read(4096).lstrip()
+    return head.startswith('{')
+
+
+# Parse and process the JSON Lines starting inside the byte range [start, end) of an
+# uncompressed file in a worker process, skipping the issues outside parse_window.
+# Returns the issues and events frames and the number of issues kept.
+def _process_json_lines_range(file_path, start, end, parse_window):
+    loader = DataLoader(file_path=file_path)
+    loader.parse_window = parse_window
+    issues = []
+    with open(file_path, 'rb') as f:
+        if start > 0:
+            # Skip the line that started in the previous range
+            f.seek(start - 1)
+            f.readline()
+        while f.tell() < end:
+            line = f.readline()
+            if not line:
+                break
+            issue = loader.parse_json_line(line)
+            if issue is not None:
+                issues.append(issue)
+    events_df = loader.process_events(issues)
+    return loader.process_issues(issues, events_df), events_df, len(issues)
+
+
+# Matches the created_date of an issue in a raw JSON line, to check it without decoding the line
+CREATED_DATE_PATTERN = re.compile(r'"created_date"\s*:\s*"([^"]*)"')
+CREATED_DATE_BYTES_PATTERN = re.compile(CREATED_DATE_PATTERN.pattern.encode())
+RELATIVE_DAYS_PATTERN = re.compile(r'(\d+)d')
+
+
+# Parse a --since/--until bound into an aware datetime: an ISO date or timestamp (naive ones are
+# taken to be UTC) or a number of days before now such as '90d'. Empty bounds give None.
+def parse_date_bound(value):
+    if value is None or value == '':
+        return None
+    if isinstance(value, datetime):
+        bound = value
+    else:
+        relative = RELATIVE_DAYS_PATTERN.fullmatch(str(value).strip())
+        if relative:
+            return datetime.now(timezone.utc) - timedelta(days=int(relative.group(1)))
+        bound = parse_date(str(value).strip())
+    return as_utc(bound)
+
+
+# Take a datetime without an offset to be in UTC, like the dates parsed with utc=True
+def as_utc(date):
+    return date if date.tzinfo is not None else date.replace(tzinfo=timezone.utc)
+
+
+# Check whether a raw created_date lies in [since, until). Dates that cannot be parsed
+# are outside of any window, like the missing created_at they would be processed into.
+def in_date_window(created_date, since, until):
+    if since is None and until is None:
+        return True
+    try:
+        created = parse_date(created_date)
+    except (ValueError, TypeError, OverflowError, AttributeError):
+        return False
+    created = as_utc(created)
+    return (since is None or created >= since) and (until is None or created < until)
+
+
+# Write issues to a JSON Lines file, one issue per line, compressing it if the
+# target path ends in .gz, .xz or .bz2
+def write_json_lines(issues, target_path):
+    openers = {'.gz': gzip.open, '.xz': lzma.open, '.bz2': bz2.open}
+    opener = openers.get(os.path.splitext(target_path)[1].lower())
+    with (opener(target_path, 'wt', encoding='utf-8') if opener else open(target_path, 'w', encoding='utf-8')) as f:
+        count = 0
+        for issue in issues:
+            f.write(json.dumps(issue))
+            f.write('\n')
+            count += 1
+    return count
+
+
+# Time each issue was open until its final close: from creation to the close, minus the time
+# it spent closed before being reopened. NaT for issues that are not closed.
+def open_durations(closed_at, created_at, closed_time):
+    # The resolution of the result depends on the inputs, so it is fixed for consistent frames
+    return (closed_at - created_at - closed_time).astype('timedelta64[ns]')
+
+
+# Low-cardinality text columns stored as categoricals by optimize_dtypes
+CATEGORICAL_COLUMNS = ['creator', 'state', 'closed_by', 'repo']
+
+
+# Convert a processed issues DataFrame to a compact schema: categorical creator, state,
+# closed_by and repo, the smallest integer type holding every issue number, and labels lists that
+# share one string object per distinct label. Returns a new DataFrame.
+def optimize_dtypes(df):
+    if df.empty:
+        return df
+    df = df.copy()
+    for column in CATEGORICAL_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].astype('category')
+    if 'number' in df.columns:
+        numbers = df['number'].astype('int64')
+        fits_int32 = numbers.between(np.iinfo(np.int32).min, np.iinfo(np.int32).max).all()
+        df['number'] = numbers.astype('int32') if fits_int32 else numbers
+    if 'labels' in df.columns:
+        canonical = {}
+        # Built from a tuple so the lists are not over-allocated
+        df['labels'] = [list(tuple(canonical.setdefault(label, label) for label in labels))
+                        if isinstance(labels, list) else [] for labels in df['labels']]
+    return df
+
+
+# Memory used by a processed issues DataFrame, in bytes per issue
+def memory_per_issue(df):
+    if df.empty:
+        return 0.0
+    return df.memory_usage(deep=True).sum() / len(df)
+
+
+# File extensions stripped when naming a repository after its issues file
+DATA_FILE_EXTENSIONS = ('.json', '.jsonl', '.ndjson', '.gz', '.zst', '.xz', '.bz2')
+
+
+# Name a repository after its issues file, e.g. 'data/poetry_issues.json.gz' becomes 'poetry_issues'
+def repo_name_from_path(file_path):
+    name = os.path.basename(file_path)
+    while True:
+        stem, extension = os.path.splitext(name)
+        if not stem or extension.lower() not in DATA_FILE_EXTENSIONS:
+            return name
+        name = stem
+
 
 class DataLoader:
-    def __init__(self, config_path='config.json'):
-        self.file_path = self.get_file_path(config_path)
+    def __init__(self, config_path='config.json', chunk_size=None, cache_dir=None, incremental=False,
+                 file_path=None, workers=None, optimize=False, since=None, until=None):
+        # The file_path in config.json is a single path, a glob, a list of paths/globs,
+        # or a mapping from repository name to path
+        self.sources = self.get_sources(file_path or self.get_file_path(config_path))
+        self.file_path = next(iter(self.sources.values()))
+        # Number of processes loading the files when several repositories are configured
+        self.workers = workers or config.get_parameter('load_workers')
+        # When set, issues are streamed from the file and processed in chunks of this size
+        self.chunk_size = chunk_size or config.get_parameter('chunk_size')
+        # When set, the processed DataFrame is cached in this directory between runs
+        self.cache_dir = cache_dir or config.get_parameter('cache_dir')
+        # When set, a changed source file only has its new and updated issues processed
+        # and merged into the cached snapshot
+        self.incremental = incremental or config.get_parameter('incremental')
+        # When set, the processed DataFrame is converted to the compact optimize_dtypes schema
+        self.optimize_dtypes = optimize or config.get_parameter('optimize_dtypes')
+        # When set, only the issues created in [since, until) are loaded
+        self.since = parse_date_bound(since or config.get_parameter('since'))
+        self.until = parse_date_bound(until or config.get_parameter('until'))
+        # The date window is applied while parsing, before any DataFrame is built. The cache
+        # holds every issue though, so with a cache the window is sliced out of it instead.
+        self.parse_window = (None, None) if self.cache_dir else (self.since, self.until)
+        # Events table (one row per event) of the last loaded issues, see process_events
+        self.events_df = None
 
     # Load the file path from config.json
     def get_file_path(self, config_path):
@@ -11,27 +271,294 @@ class DataLoader:
             config = json.load(f)
         return config['file_path']
 
-    # Load the issues from the JSON file
+    # Resolve the configured file path(s) into a mapping from repository name to file path
+    def get_sources(self, file_path):
+        if isinstance(file_path, dict):
+            return dict(file_path)
+        patterns = [file_path] if isinstance(file_path, str) else list(file_path)
+        paths = []
+        for pattern in patterns:
+            # Paths that match nothing are kept as they are so that opening them reports the error
+            matches = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else []
+            paths.extend(matches or [pattern])
+        sources = {}
+        for path in paths:
+            repo = repo_name_from_path(path)
+            if sources.get(repo, path) != path:
+                # e.g. pip_issues.json next to pip_issues.json.gz, which would load the repository twice
+                raise ValueError(f"Files '{sources[repo]}' and '{path}' are both named '{repo}'. "
+                                 "Map repository names to paths in file_path to load both.")
+            sources[repo] = path
+        return sources
+
+    # Load the issues from the JSON (or JSON Lines) file, decompressing it if needed
+    # and skipping the issues outside the date window. With a window a JSON array is
+    # streamed too, so skipped issues are dropped as they are decoded rather than held
+    # in the whole decoded array; unlike JSON Lines they still have to be decoded.
+    @profiling.timed('parse_json')
     def load_issues(self):
-        with open(self.file_path, 'r') as f:
-            issues = json.load(f)
-        return issues
+        if is_json_lines(self.file_path) or self.parse_window != (None, None):
+            return list(self.iter_issues())
+        with open_source(self.file_path) as f:
+            return json.load(f)
+
+    # Check whether a raw issue was created inside the date window applied while parsing
+    def in_window(self, issue):
+        since, until = self.parse_window
+        return in_date_window(issue.get('created_date'), since, until)
+
+    # Decode one line of a JSON Lines file, or return None for a blank line or an issue
+    # outside the date window. The created_date is checked before the line is decoded
+    # when it can be found in the raw line, so skipped issues are never decoded.
+    def parse_json_line(self, line):
+        if not line.strip():
+            return None
+        since, until = self.parse_window
+        if since is None and until is None:
+            return json.loads(line)
+        pattern = CREATED_DATE_BYTES_PATTERN if isinstance(line, bytes) else CREATED_DATE_PATTERN
+        match = pattern.search(line)
+        if match is not None:
+            created_date = match.group(1)
+            if isinstance(created_date, bytes):
+                created_date = created_date.decode('utf-8')
+            return json.loads(line) if in_date_window(created_date, since, until) else None
+        issue = json.loads(line)
+        return issue if self.in_window(issue) else None
+
+    # Stream the issues from the JSON file one at a time without loading the whole array.
+    # At most one buffer of raw text plus the issue being decoded is held in memory.
+    # Issues outside the date window are skipped.
+    def iter_issues(self, buffer_size=STREAM_BUFFER_SIZE):
+        if is_json_lines(self.file_path):
+            yield from self.iter_json_lines()
+            return
+
+        decoder = json.JSONDecoder()
+        with open_source(self.file_path) as f:
+            buf, pos, eof = '', 0, False
+            read_size = buffer_size
+
+            def fill():
+                # Drop the consumed prefix and append the next block of the file
+                nonlocal buf, pos, eof
+                block = f.read(read_size)
+                eof = not block
+                buf = buf[pos:] + block
+                pos = 0
+
+            def skip_whitespace():
+                nonlocal pos
+                while True:
+                    while pos < len(buf) and buf[pos].isspace():
+                        pos += 1
+                    if pos < len(buf) or eof:
+                        return
+                    fill()
+
+            skip_whitespace()
+            if pos >= len(buf):
+                return
+            if buf[pos] != '[':
+                raise ValueError("Streaming mode expects a top-level JSON array of issues.")
+            pos += 1
+
+            skip_whitespace()
+            if pos < len(buf) and buf[pos] == ']':
+                return
+            while True:
+                skip_whitespace()
+                try:
+                    issue, end = decoder.raw_decode(buf, pos)
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                    # The issue spans past the buffer, read more (growing the read size
+                    # so very large issues do not get re-decoded too many times)
+                    fill()
+                    read_size *= 2
+                    continue
+                if end == len(buf) and not eof:
+                    # A value ending exactly at the buffer edge may be truncated
+                    fill()
+                    continue
+                read_size = buffer_size
+                pos = end
+                if self.in_window(issue):
+                    yield issue
+
+                skip_whitespace()
+                if pos >= len(buf):
+                    raise ValueError("Unexpected end of file while streaming issues.")
+                if buf[pos] == ']':
+                    return
+                if buf[pos] != ',':
+                    raise ValueError(f"Expected ',' or ']' at offset {pos} while streaming issues.")
+                pos += 1
+
+    # Stream the issues from a JSON Lines file, one issue per line
+    def iter_json_lines(self):
+        with open_source(self.file_path) as f:
+            for line in f:
+                issue = self.parse_json_line(line)
+                if issue is not None:
+                    yield issue
+
+    # Write the issues of the source file to a JSON Lines file without loading them all at once
+    def convert_to_json_lines(self, target_path):
+        return write_json_lines(self.iter_issues(), target_path)
+
+    # Split an uncompressed JSON Lines file into byte ranges parsed and processed by
+    # a pool of worker processes, then combine the results in file order
+    @profiling.timed('parse_json_lines_parallel')
+    def load_and_process_json_lines_parallel(self):
+        size = os.path.getsize(self.file_path)
+        shards = int(self.workers or os.cpu_count() or 1)
+        bounds = [size * i // shards for i in range(shards + 1)]
+        with ProcessPoolExecutor(max_workers=shards) as pool:
+            futures = [pool.submit(_process_json_lines_range, self.file_path, start, end, self.parse_window)
+                       for start, end in zip(bounds[:-1], bounds[1:])]
+            results = [future.result() for future in futures]
+
+        frames, event_frames = [], []
+        offset = 0
+        for frame, events_df, count in results:
+            # Keep the same row labels as a serial load of the whole file
+            frame.index += offset
+            events_df.index += offset
+            offset += count
+            event_frames.append(events_df)
+            if not frame.empty:
+                frames.append(frame)
+        if not frames:
+            print("No issues found in the JSON file.")
+            self.events_df = events_frame([], [])
+            return pd.DataFrame()
+
+        # Duplicates may span ranges, so deduplicate again on the combined frame
+        df = pd.concat(frames).drop_duplicates(subset='number').infer_objects()
+        self.events_df = self.select_events(pd.concat(event_frames), df)
+        return df
+
+    # Whether the source is a JSON Lines file worth splitting across processes
+    def use_parallel_json_lines(self):
+        if not is_json_lines(self.file_path) or detect_compression(self.file_path) is not None:
+            return False
+        return bool(self.workers) or os.path.getsize(self.file_path) >= JSON_LINES_PARALLEL_MIN_BYTES
+
+    # Group the streamed issues into lists of at most chunk_size issues
+    def iter_issue_chunks(self, chunk_size):
+        chunk = []
+        for issue in self.iter_issues():
+            chunk.append(issue)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
 
     # Helper function to find who closed the issue and when
     def get_closing_event(self, events):
+        closing_event = None
+        for event in events:
+            # A reopen cancels the close before it, so the last close after the last reopen wins
+            if event.get("event_type") == CLOSED_EVENT:
+                closing_event = event
+            elif event.get("event_type") == REOPENED_EVENT:
+                closing_event = None
+        if closing_event is None:
+            return None, None
+        return closing_event.get("author"), closing_event.get("event_date")
+
+    # Count the reopens of an issue and the total time it spent closed before each reopen
+    def get_reopen_stats(self, events):
+        reopen_count = 0
+        closed_time = pd.Timedelta(0)
+        previous = None
         for event in events:
-            if event.get("event_type") == "closed":
-                return event.get("author"), event.get("event_date")
-        return None, None
+            event_type = event.get("event_type")
+            if event_type not in (CLOSED_EVENT, REOPENED_EVENT):
+                continue
+            if event_type == REOPENED_EVENT:
+                reopen_count += 1
+                if previous is not None and previous.get("event_type") == CLOSED_EVENT:
+                    gap = parse_event_dates([event.get("event_date")])[0] - parse_event_dates([previous.get("event_date")])[0]
+                    if not pd.isna(gap):
+                        closed_time += gap
+            previous = event
+        return reopen_count, closed_time
     
-    # Process the issues and return them as a pandas DataFrame
-    def process_issues(self, issues):
+    # Process the issues and return them as a pandas DataFrame.
+    # Columns are built directly from the parsed records instead of one dict per issue,
+    # the closing events of all issues are resolved at once over their events table and
+    # text is normalised while building the columns rather than in a second pass.
+    # events_df is the process_events table of the same issues, built here if not given.
+    @profiling.timed('process_issues')
+    def process_issues(self, issues, events_df=None):
+        if not issues:
+            return self.clean_issues(pd.DataFrame())
+
+        if events_df is None:
+            events_df = self.process_events(issues)
+        resolved = resolve_closing_events(events_df).reindex(pd.RangeIndex(len(issues)))
+        # Only issues in the closed state get a closing event
+        closed_state = pd.Series([issue.get('state') == 'closed' for issue in issues])
+        closed_by = resolved['closed_by'].astype(object).where(closed_state & resolved['closed_by'].notna(), None)
+        closed_time = resolved['closed_time'].fillna(pd.Timedelta(0))
+        # Low-cardinality columns are normalised once per distinct value
+        state_cache, closed_by_cache = {}, {}
+        df = pd.DataFrame({
+            'number': [issue.get('number') for issue in issues],
+            'creator': [issue.get('creator') for issue in issues],
+            'title': [normalize_text(issue.get('title')) for issue in issues],
+            'state': [normalize_text(issue.get('state'), state_cache) for issue in issues],
+            'created_at': [issue.get('created_date') for issue in issues],
+            'updated_at': [issue.get('updated_date') for issue in issues],
+            'labels': [labels if isinstance(labels, list) else []
+                       for labels in (issue.get('labels', []) for issue in issues)],
+            'closed_by': [normalize_text(author, closed_by_cache) for author in closed_by],
+            'closed_at': resolved['closed_at'].where(closed_state),
+            'reopen_count': resolved['reopen_count'].fillna(0).astype('int64'),
+        })
+
+        df = df[df['number'].notnull()]
+        df = df.drop_duplicates(subset='number')
+        df['created_at'] = pd.to_datetime(df['created_at'], errors='coerce', utc=True)
+        df['updated_at'] = pd.to_datetime(df['updated_at'], errors='coerce', utc=True)
+        df['open_duration'] = open_durations(df['closed_at'], df['created_at'], closed_time[df.index])
+        return df
+
+    # Build the events table of the issues in the same pass over the loaded issues: one row
+    # per event with typed columns (see event_stats.events_frame), labelled with the
+    # position of its issue. Issues without a number are skipped like in process_issues.
+    @profiling.timed('process_events')
+    def process_events(self, issues):
+        positions = [position for position, issue in enumerate(issues) if issue.get('number') is not None]
+        return events_frame([issues[position].get('events') for position in positions],
+                            [issues[position].get('number') for position in positions],
+                            index=positions)
+
+    # Keep the events of the issues that survived processing, e.g. only the first copy of a
+    # duplicated issue, matching event rows to issue rows by their labels
+    def select_events(self, events_df, issues_df):
+        return events_df[events_df.index.isin(issues_df.index)].reset_index(drop=True)
+
+    # Return the events table of the loaded issues, loading them first if needed
+    def get_events(self):
+        if self.events_df is None:
+            self.load_and_process_issues()
+        return self.events_df
+
+    # Reference implementation building one dict per issue, kept to check and benchmark
+    # the column-wise process_issues against
+    def process_issues_rowwise(self, issues):
         processed_issues = []
         for issue in issues:
             # Extract the closed event author and date if the state is closed
             closed_by, closed_at = None, None
             if issue.get('state') == 'closed':
                 closed_by, closed_at = self.get_closing_event(issue.get("events", []))
+            reopen_count, closed_time = self.get_reopen_stats(issue.get("events", []))
             
             processed_issue = {
                 'number': issue.get('number'),
@@ -42,20 +569,27 @@ class DataLoader:
                 'updated_at': issue.get('updated_date'),
                 'labels': issue.get('labels', []),
                 'closed_by': closed_by,          # Add closed_by column
-                'closed_at': closed_at           # Add closed_at column
+                'closed_at': closed_at,          # Add closed_at column
+                'reopen_count': reopen_count,
+                'closed_time': closed_time,
             }
             processed_issues.append(processed_issue)
         
         # Convert to DataFrame for better visualization
         df = pd.DataFrame(processed_issues)
-        
-        # Data cleaning
+        df = self.clean_issues(df)
+        if not df.empty:
+            df['open_duration'] = open_durations(df['closed_at'], df['created_at'], df.pop('closed_time'))
+        return df
+
+    # Data cleaning shared by both processing paths
+    def clean_issues(self, df):
         if not df.empty:
             df = df[df['number'].notnull()]
             df = df.drop_duplicates(subset='number')
-            df['created_at'] = pd.to_datetime(df['created_at'], errors='coerce')
-            df['updated_at'] = pd.to_datetime(df['updated_at'], errors='coerce')
-            df['closed_at'] = pd.to_datetime(df['closed_at'], errors='coerce')
+            df['created_at'] = pd.to_datetime(df['created_at'], errors='coerce', utc=True)
+            df['updated_at'] = pd.to_datetime(df['updated_at'], errors='coerce', utc=True)
+            df['closed_at'] = parse_event_dates(df['closed_at'])
             df['closed_by'] = df['closed_by'].str.strip().str.lower()
             df['labels'] = df['labels'].apply(lambda x: x if isinstance(x, list) else [])
             df['title'] = df['title'].str.strip().str.lower()
@@ -65,22 +599,241 @@ class DataLoader:
         
         return df
 
+    # Stream the file and process it chunk by chunk so that only chunk_size raw
+    # issues are held in memory at any time
+    @profiling.timed('stream')
+    def load_and_process_issues_streaming(self, chunk_size):
+        frames, event_frames = [], []
+        offset = 0
+        for chunk in self.iter_issue_chunks(chunk_size):
+            events_df = self.process_events(chunk)
+            frame = self.process_issues(chunk, events_df)
+            # Keep the same row labels as a non-streaming load of the whole array
+            frame.index += offset
+            events_df.index += offset
+            offset += len(chunk)
+            frames.append(frame)
+            event_frames.append(events_df)
+        if not frames:
+            print("No issues found in the JSON file.")
+            self.events_df = events_frame([], [])
+            return pd.DataFrame()
+
+        df = pd.concat(frames)
+        # Duplicates may span chunks, so deduplicate again on the combined frame
+        df = df.drop_duplicates(subset='number')
+        # Columns that were all missing in some chunks fall back to object dtype when concatenated
+        df = df.infer_objects()
+        self.events_df = self.select_events(pd.concat(event_frames), df)
+        return df
+
+    # Build the key identifying the current state of the source file. The hash only
+    # covers the first and last block of the file so that checking it stays cheap
+    # for multi-GB files; path, mtime and size catch the remaining changes.
+    def get_cache_key(self):
+        stat = os.stat(self.file_path)
+        digest = hashlib.sha256()
+        with open(self.file_path, 'rb') as f:
+            digest.update(f.read(CACHE_HASH_BLOCK_SIZE))
+            if stat.st_size > 2 * CACHE_HASH_BLOCK_SIZE:
+                f.seek(-CACHE_HASH_BLOCK_SIZE, os.SEEK_END)
+                digest.update(f.read())
+        return {
+            'version': CACHE_VERSION,
+            'path': os.path.abspath(self.file_path),
+            'mtime': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'hash': digest.hexdigest(),
+        }
+
+    # Location of the cached issues frame, its key and the cached events frame for the current source file
+    def get_cache_paths(self):
+        name = hashlib.sha256(os.path.abspath(self.file_path).encode('utf-8')).hexdigest()[:16]
+        base = os.path.join(self.cache_dir, f'issues-{name}')
+        return base + '.pkl', base + '.json', os.path.join(self.cache_dir, f'events-{name}.pkl')
+
+    # Return the cached DataFrame if it was built from the current source file.
+    # With any_version=True, a snapshot built from an older version of the file is returned too.
+    # current_key is the key of the source file, computed here if not given.
+    @profiling.timed('cache_read')
+    def load_cached_issues(self, any_version=False, current_key=None):
+        frame_path, key_path, events_path = self.get_cache_paths()
+        try:
+            with open(key_path, 'r') as f:
+                cached_key = json.load(f)
+        except (OSError, ValueError):
+            return None
+        current_key = current_key or self.get_cache_key()
+        if any_version:
+            if (cached_key.get('version'), cached_key.get('path')) != (current_key['version'], current_key['path']):
+                return None
+        elif cached_key != current_key:
+            return None
+        try:
+            df = pd.read_pickle(frame_path)
+            self.events_df = pd.read_pickle(events_path)
+        except Exception:
+            return None
+        return df
+
+    # Store the processed DataFrame along with the key of the source it was built from. The key
+    # should be taken before the source is read, so that a file changed while it was being parsed
+    # does not get the old content cached under its new key; it is computed here if not given.
+    @profiling.timed('cache_write')
+    def save_cached_issues(self, df, cache_key=None):
+        cache_key = cache_key or self.get_cache_key()
+        os.makedirs(self.cache_dir, exist_ok=True)
+        frame_path, key_path, events_path = self.get_cache_paths()
+        # Write to temporary files first so a crash never leaves a half-written cache
+        df.to_pickle(frame_path + '.tmp')
+        os.replace(frame_path + '.tmp', frame_path)
+        self.events_df.to_pickle(events_path + '.tmp')
+        os.replace(events_path + '.tmp', events_path)
+        with open(key_path + '.tmp', 'w') as f:
+            json.dump(cache_key, f)
+        os.replace(key_path + '.tmp', key_path)
+
+    # Check whether a raw issue was updated at or after the given time. Issues without
+    # a parseable updated_date are treated as updated so they are never missed.
+    # Dates without an offset are taken as UTC, like updated_at in the snapshot.
+    def is_updated_since(self, issue, since):
+        try:
+            return as_utc(parse_date(issue.get("updated_date"))) >= as_utc(since)
+        except (ValueError, TypeError, OverflowError):
+            return True
+
+    # Bring a previously processed snapshot up to date with the source file by only
+    # processing the issues updated after the newest issue in the snapshot.
+    # The updated issues replace their old rows by number, like drop_duplicates(subset='number')
+    # keeping the newest version. Issues removed from the source are not removed from the snapshot.
+    @profiling.timed('incremental_update')
+    def update_issues(self, previous_df):
+        since = previous_df['updated_at'].max()
+        if pd.isna(since):
+            return self.load_and_process_source()
+        since = since.to_pydatetime()
+
+        previous_events_df = self.events_df
+        updated_issues = [issue for issue in self.iter_issues() if self.is_updated_since(issue, since)]
+        print(f"Found {len(updated_issues)} new or updated issues since {since}.")
+        if not updated_issues:
+            return previous_df
+
+        updated_events_df = self.process_events(updated_issues)
+        updated_df = self.process_issues(updated_issues, updated_events_df)
+        updated_events_df = self.select_events(updated_events_df, updated_df)
+        kept_df = previous_df[~previous_df['number'].isin(updated_df['number'])]
+        merged_df = pd.concat([kept_df, updated_df], ignore_index=True)
+        kept_events_df = previous_events_df[~previous_events_df['issue_number'].isin(updated_df['number'])]
+        self.events_df = pd.concat([kept_events_df, updated_events_df], ignore_index=True)
+        # Columns that were all missing on one side fall back to object dtype when concatenated
+        return merged_df.infer_objects()
+
+    # Load every configured repository in parallel and combine them into one frame with a 'repo' column
+    @profiling.timed('load_repos')
+    def load_and_process_repos(self):
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            futures = [pool.submit(_load_repo, repo, path, self.chunk_size, self.cache_dir, self.incremental,
+                                   self.since, self.until)
+                       for repo, path in self.sources.items()]
+            results = [future.result() for future in futures]
+        frames = [frame for frame, _ in results if not frame.empty]
+        self.events_df = pd.concat([events_df for _, events_df in results], ignore_index=True)
+        if not frames:
+            return pd.DataFrame()
+        # Issue numbers are only unique within a repository
+        return pd.concat(frames, ignore_index=True).infer_objects()
+
+    @profiling.timed('load')
     def load_and_process_issues(self):
+        df = self.load_processed_issues()
+        if self.optimize_dtypes:
+            with profiling.stage('optimize_dtypes'):
+                df = optimize_dtypes(df)
+            print(f"Processed issues use {memory_per_issue(df):.0f} bytes per issue")
+        return df
+
+    # Load the processed issues from the sources or the cache, with the default dtypes
+    def load_processed_issues(self):
+        if len(self.sources) > 1:
+            return self.load_and_process_repos()
+        if self.cache_dir:
+            # The cache holds every issue, so the date window is sliced out of it
+            return self.select_window(self.load_cached_or_source())
+        return self.load_and_process_source()
+
+    # Keep the issues created inside the date window, and their events. A single pass
+    # over created_at is cheaper than sorting it for an index that is used only once.
+    def select_window(self, df):
+        if (self.since is None and self.until is None) or df.empty:
+            return df
+        created_at = df['created_at']
+        mask = created_at.notna()
+        if self.since is not None:
+            mask &= created_at >= to_timestamp(self.since, created_at)
+        if self.until is not None:
+            mask &= created_at < to_timestamp(self.until, created_at)
+        df = df[mask]
+        self.events_df = self.events_df[self.events_df['issue_number'].isin(df['number'])].reset_index(drop=True)
+        return df
+
+    # Load the processed issues from the cache, bringing it up to date in incremental mode,
+    # or process the source file and cache it
+    def load_cached_or_source(self):
+        # The key of the source as it is before being read, stored with whatever gets cached
+        cache_key = self.get_cache_key()
+        cached_df = self.load_cached_issues(current_key=cache_key)
+        if cached_df is not None:
+            return cached_df
+
+        # Only the changes since the previous snapshot are processed in incremental mode
+        if self.incremental:
+            previous_df = self.load_cached_issues(any_version=True, current_key=cache_key)
+            if previous_df is not None and not previous_df.empty:
+                merged_df = self.update_issues(previous_df)
+                self.save_cached_issues(merged_df, cache_key)
+                return merged_df
+
+        processed_df = self.load_and_process_source()
+        if not processed_df.empty:
+            self.save_cached_issues(processed_df, cache_key)
+        return processed_df
+
+    # Parse and process the source file, bypassing the cache
+    def load_and_process_source(self):
+        if self.chunk_size:
+            return self.load_and_process_issues_streaming(int(self.chunk_size))
+        if self.use_parallel_json_lines():
+            return self.load_and_process_json_lines_parallel()
+
         # Load and process issues
         issues = self.load_issues()
         
         # Check if issues were loaded correctly
         if not issues:
             print("No issues found in the JSON file.")
+            self.events_df = events_frame([], [])
             return pd.DataFrame()  # Return an empty DataFrame if no issues found
         
-        # Process the issues and return the DataFrame
-        processed_df = self.process_issues(issues)
+        # Process the issues and their events and return the issues DataFrame
+        events_df = self.process_events(issues)
+        processed_df = self.process_issues(issues, events_df)
+        self.events_df = self.select_events(events_df, processed_df)
         return processed_df
 
 # Example of how to use the DataLoader class
 if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser(description='Load and summarise the configured issues')
+    parser.add_argument('--to-jsonl', metavar='PATH',
+                        help='Convert the configured data file to JSON Lines at PATH instead')
+    args = parser.parse_args()
+
     data_loader = DataLoader()
+    if args.to_jsonl:
+        count = data_loader.convert_to_json_lines(args.to_jsonl)
+        print(f"Wrote {count} issues to {args.to_jsonl}")
+        raise SystemExit(0)
     df = data_loader.load_and_process_issues()
 
     # Display basic information about the DataFrame
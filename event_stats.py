@@ -0,0 +1,125 @@
+"""
+Vectorised statistics over the events of the loaded issues. Events are
+held in a long-format DataFrame with one row per event, built by the
+DataLoader when the issues are processed, so the counts are computed with
+pandas operations instead of materialising an Issue and Event object for
+every row.
+"""
+
+import numpy as np
+import pandas as pd
+
+EVENT_COLUMNS = ['issue_number', 'event_type', 'author', 'event_date', 'label']
+CLOSED_EVENT = 'closed'
+REOPENED_EVENT = 'reopened'
+
+
+def parse_event_dates(values) -> pd.DatetimeIndex:
+    """
+    Parses event timestamps to UTC, with NaT for missing or invalid ones.
+    """
+    return pd.to_datetime(values, format='ISO8601', errors='coerce', utc=True)
+
+
+def events_frame(events_per_issue, issue_numbers, index=None) -> pd.DataFrame:
+    """
+    Builds the long-format events table, one row per event, from one list of
+    raw event dicts per issue. event_date is parsed to UTC timestamps and label
+    is only set for label events. If index holds one label per issue, every
+    event row is labelled with the label of its issue.
+    """
+    events_per_issue = [events if isinstance(events, list) else [] for events in events_per_issue]
+    counts = [len(events) for events in events_per_issue]
+    flat_events = [event for events in events_per_issue for event in events]
+    numbers = pd.Series(issue_numbers).to_numpy() if len(issue_numbers) else np.empty(0, dtype='int64')
+    return pd.DataFrame({
+        'issue_number': np.repeat(numbers, counts),
+        'event_type': pd.Series([event.get('event_type') for event in flat_events], dtype='str'),
+        'author': pd.Series([event.get('author') for event in flat_events], dtype='str'),
+        'event_date': parse_event_dates([event.get('event_date') for event in flat_events]),
+        'label': pd.Series([event.get('label') for event in flat_events], dtype='str'),
+    }).set_axis(np.repeat(np.asarray(index, dtype='int64'), counts) if index is not None else
+                pd.RangeIndex(len(flat_events)))
+
+
+def resolve_closing_events(events_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Resolves how every issue was last closed from its 'closed' and 'reopened'
+    events, taken in their recorded (chronological) order. The events are
+    grouped by their row labels, which must identify their issue as in the
+    tables built by DataLoader.process_events.
+
+    Returns one row per issue label with the issue's reopen_count, its
+    closed_time (the total time between each close and the reopen right after
+    it) and, from its last close if no reopen follows it, closed_by and closed_at.
+    """
+    transitions = events_df[events_df['event_type'].isin([CLOSED_EVENT, REOPENED_EVENT])]
+    grouped = transitions.groupby(level=0, sort=False)
+    is_reopen = transitions['event_type'] == REOPENED_EVENT
+    reopens_closed = is_reopen & (grouped['event_type'].shift() == CLOSED_EVENT)
+    closed_gaps = (transitions['event_date'] - grouped['event_date'].shift()).where(reopens_closed)
+
+    # The final transition of an issue is its closing event unless it is a reopen
+    last = transitions[~transitions.index.duplicated(keep='last')]
+    closing = last[last['event_type'] == CLOSED_EVENT]
+
+    resolved = pd.DataFrame({
+        'reopen_count': is_reopen.groupby(level=0, sort=False).sum(),
+        'closed_time': closed_gaps.groupby(level=0, sort=False).sum(),
+    })
+    resolved['closed_by'] = closing['author']
+    resolved['closed_at'] = closing['event_date']
+    return resolved
+
+
+def events_from_issues(issues_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Flattens the raw 'events' lists of an issues DataFrame into one row per
+    event. Returns an empty events frame if the issues carry no events.
+    """
+    if issues_df.empty or 'events' not in issues_df.columns:
+        return events_frame([], [])
+    numbers = issues_df['number'] if 'number' in issues_df.columns else issues_df.index.to_series()
+    return events_frame(issues_df['events'], numbers)
+
+
+class EventStats:
+    """
+    Event counts over a long-format events DataFrame.
+    """
+
+    def __init__(self, events_df: pd.DataFrame):
+        """
+        Constructor
+        """
+        self.events_df: pd.DataFrame = events_df
+
+    @classmethod
+    def from_issues(cls, issues_df: pd.DataFrame, events_df: pd.DataFrame = None) -> 'EventStats':
+        """
+        Builds the statistics from the events table of the issues if it is given,
+        and otherwise from the 'events' column of the issues DataFrame.
+        """
+        if isinstance(events_df, pd.DataFrame):
+            return cls(events_df)
+        return cls(events_from_issues(issues_df))
+
+    def total(self, author: str = None) -> int:
+        """
+        Total number of events, optionally only those by the given author.
+        """
+        if author is None:
+            return len(self.events_df)
+        return int((self.events_df['author'] == author).sum())
+
+    def per_author(self) -> pd.Series:
+        """
+        Number of events by each author, most active first.
+        """
+        return self.events_df['author'].value_counts()
+
+    def per_type(self) -> pd.Series:
+        """
+        Number of events of each type, most frequent first.
+        """
+        return self.events_df['event_type'].value_counts()
@@ -1,8 +1,27 @@
 import matplotlib.pyplot as plt
 import pandas as pd
 from data_loader import DataLoader
+import plotting
+import profiling
+from label_index import LabelIndex
 import config
 
+def label_close_time_stats(close_time: pd.Series, label_index: LabelIndex) -> pd.DataFrame:
+    """
+    Computes the count, mean, median and 90th percentile of the close time
+    of the issues of each label in one grouped pass. close_time holds one
+    Timedelta per issue, aligned with the rows of label_index.
+    """
+    # Aggregate on float seconds so that missing close times are skipped as NaN
+    grouped = label_index.group(close_time.dt.total_seconds())
+    stats = grouped.agg(['count', 'mean', 'median'])
+    stats['p90'] = grouped.quantile(0.9)
+    for column in ('mean', 'median', 'p90'):
+        stats[column] = pd.to_timedelta(stats[column], unit='s')
+    stats.index.name = 'label'
+    return stats
+
+
 class IssueCloseTimeAnalysis:
     """
     Analyzes GitHub issues by calculating the average time to close each issue type. Ignores non closed issues and those without a close time.
@@ -15,13 +34,16 @@ class IssueCloseTimeAnalysis:
         # Parameter is passed in via command line (--user), unused in this analysis
         self.USER: str = config.get_parameter('user')
 
-    def run(self):
+    @profiling.timed('close_time_analysis')
+    def run(self, issues_df: pd.DataFrame = None, label_index: LabelIndex = None):
         """
-        Starting point for this analysis.
+        Starting point for this analysis. A LabelIndex built over issues_df
+        can be passed in to avoid indexing the labels again.
         """
-        # Use the DataLoader to load and process issues
-        data_loader = DataLoader()
-        issues_df = data_loader.load_and_process_issues()
+        # Use the DataLoader to load and process issues unless they were passed in, e.g. from a shared IssueStore
+        if issues_df is None:
+            data_loader = DataLoader()
+            issues_df = data_loader.load_and_process_issues()
 
         # Check if issues were loaded correctly
         if issues_df.empty:
@@ -29,55 +51,52 @@ class IssueCloseTimeAnalysis:
             return
 
         # Get only closed issues so we can analyze the close time, ignores missing times for close_at
-        closed_issues_df = issues_df[issues_df['state'] == 'closed']
-        closed_issues_df = closed_issues_df.dropna(subset=['closed_at'])
+        closed_mask = (issues_df['state'] == 'closed') & issues_df['closed_at'].notna()
+        closed_issues_df = issues_df[closed_mask]
 
         # Calculate the close time
-        closed_issues_df['close_time'] = closed_issues_df['closed_at'] - closed_issues_df['created_at']
-
-        # Get unique labels across all issues
-        unique_labels = set(label for sublist in closed_issues_df['labels'] for label in sublist)
-
-        # Create a dictionary to store DataFrames for each label
-        label_dfs = {}
-
-        for label in unique_labels:
-            # Filter rows that contain the current label
-            label_dfs[label] = closed_issues_df[closed_issues_df['labels'].apply(lambda x: label in x)].reset_index(drop=True)
+        close_time = closed_issues_df['closed_at'] - closed_issues_df['created_at']
 
-        label_close_times = {label: [] for label in unique_labels}
-        # For each issue, add its close time to the corresponding label(s)
-        
-        for index, row in closed_issues_df.iterrows():
-            for label in row['labels']:
-                label_close_times[label].append(row['close_time'])
+        # Restrict the shared label index to the closed issues, or build one if none was passed in
+        if label_index is not None:
+            closed_label_index = label_index.subset(closed_mask.to_numpy())
+        else:
+            closed_label_index = LabelIndex.from_issues(closed_issues_df)
 
-        # Calculate the average close time for each label
-        average_close_times = {label: pd.to_timedelta(sum(times, pd.Timedelta(0)) / len(times)) for label, times in label_close_times.items()}
+        # Calculate the close time statistics for each label over the issues carrying it.
+        # The mean alone is misleading for long-tailed close times, so median and p90 are included.
+        close_time_stats = label_close_time_stats(close_time, closed_label_index)
+        average_close_times = close_time_stats['mean']
 
-        # Display the average close time for each label
-        for label, avg_close_time in average_close_times.items():
-            print(f"Average Close Time for label '{label}': {avg_close_time}")
+        # Display the close time statistics for each label
+        for label, row in close_time_stats.iterrows():
+            print(f"Average Close Time for label '{label}': {row['mean']} "
+                  f"(median {row['median']}, p90 {row['p90']}, {row['count']} issues)")
 
-        # Sort the labels alphabetically
-        sorted_labels = sorted(average_close_times.keys())
+        # The aggregated labels are sorted alphabetically
+        sorted_labels = close_time_stats.index.tolist()
 
         #convert to days (86400 seconds in 1 day)
-        average_times_in_days = [avg_time.total_seconds() / 86400 for avg_time in average_close_times.values()]
+        average_times_in_days = (average_close_times.dt.total_seconds() / 86400).tolist()
 
         # Create the plot
         plt.figure(figsize=(10, 6))
-        plt.bar(sorted_labels, average_times_in_days, color='skyblue')
+        plt.bar(sorted_labels, average_times_in_days, color='skyblue', label='Mean')
+        plt.scatter(sorted_labels, close_time_stats['median'].dt.total_seconds() / 86400,
+                    color='navy', marker='_', s=200, zorder=3, label='Median')
+        plt.scatter(sorted_labels, close_time_stats['p90'].dt.total_seconds() / 86400,
+                    color='salmon', marker='_', s=200, zorder=3, label='90th percentile')
+        plt.legend()
 
         # Add labels and title
         plt.xlabel('Label')
-        plt.ylabel('Average Close Time (days)')
-        plt.title('Average Close Time for Each Label')
+        plt.ylabel('Close Time (days)')
+        plt.title('Close Time for Each Label')
         plt.xticks(rotation=45, ha='right')  # Rotate labels for better visibility
 
         # Display the plot
         plt.tight_layout()
-        plt.show()
+        plotting.show('close_time_by_label')
 
 if __name__ == '__main__':
     # Invoke run method when running this module directly
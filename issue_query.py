@@ -0,0 +1,254 @@
+"""
+Query API over the processed issues. Predicates on labels, creator, state,
+closed_by and a date range are evaluated on the compact issues DataFrame,
+with one row per issue, using indexes of row positions per label and per
+column value, so that only the matching issues are ever copied or exploded.
+"""
+
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from label_index import LabelIndex
+
+
+def to_timestamp(value, like: pd.Series) -> pd.Timestamp:
+    """
+    Converts a date (string, datetime or Timestamp) to a Timestamp comparable
+    with the datetime column like: naive dates are taken to be in the column's
+    time zone, and aware dates are converted to it.
+    """
+    timestamp = pd.Timestamp(value)
+    tz = getattr(like.dtype, 'tz', None)
+    if tz is not None:
+        return timestamp.tz_localize(tz) if timestamp.tz is None else timestamp.tz_convert(tz)
+    return timestamp.tz_convert('UTC').tz_localize(None) if timestamp.tz is not None else timestamp
+
+
+class ColumnIndex:
+    """
+    Sorted row positions of every distinct value of a column, built once with
+    a single factorize so that looking up the rows of a value does not scan
+    the column.
+    """
+
+    def __init__(self, column: pd.Series):
+        """
+        Constructor. Missing values are not indexed.
+        """
+        codes, uniques = pd.factorize(column)
+        present = np.flatnonzero(codes >= 0)
+        order = present[np.argsort(codes[present], kind='stable')]
+        bounds = np.cumsum(np.bincount(codes[present], minlength=len(uniques)))
+        self._positions = dict(zip(uniques, np.split(order, bounds[:-1])))
+
+    def positions(self, value) -> np.ndarray:
+        """
+        Sorted row positions of the rows holding value.
+        """
+        return self._positions.get(value, np.empty(0, dtype=np.intp))
+
+
+class SortedIndex:
+    """
+    Row positions of a date column sorted by date, so that the rows in a date
+    range are found with two binary searches instead of a scan of the column.
+    """
+
+    def __init__(self, column: pd.Series):
+        """
+        Constructor. Missing dates are not indexed.
+        """
+        self._like = column.iloc[:0]
+        present = np.flatnonzero(column.notna().to_numpy())
+        values = column.iloc[present]
+        if getattr(values.dtype, 'tz', None) is not None:
+            values = values.dt.tz_localize(None)
+        values = values.to_numpy()
+        order = np.argsort(values, kind='stable')
+        self._values = values[order]
+        self._positions = present[order]
+
+    def _search(self, bound) -> int:
+        timestamp = to_timestamp(bound, self._like)
+        if timestamp.tz is not None:
+            timestamp = timestamp.tz_localize(None)
+        return int(np.searchsorted(self._values, timestamp.to_datetime64(), side='left'))
+
+    def positions(self, since=None, until=None) -> np.ndarray:
+        """
+        Sorted row positions of the rows dated at or after since and before until.
+        """
+        start = 0 if since is None else self._search(since)
+        end = len(self._values) if until is None else self._search(until)
+        return np.sort(self._positions[start:max(start, end)])
+
+
+class IssueQuery:
+    """
+    A set of predicates over an issues DataFrame. Every predicate method
+    returns a new query, so queries can be chained and reused:
+
+        IssueQuery(issues_df).label('kind/bug').creator('abn').issues()
+
+    The label, creator, state and closed_by predicates also take a list of
+    values, keeping the issues that match any of them.
+    """
+
+    # Columns whose values are normalised (stripped and lower-cased) by the DataLoader
+    NORMALIZED_COLUMNS = ('state', 'closed_by')
+
+    def __init__(self, issues_df: pd.DataFrame, label_index: LabelIndex = None,
+                 indexes: Dict[str, ColumnIndex] = None):
+        """
+        Constructor. label_index and indexes are optional indexes over issues_df;
+        column indexes that are missing are built on first use and added to
+        indexes, so a dict shared between queries keeps them for later queries.
+        """
+        self.issues_df: pd.DataFrame = issues_df
+        self.label_index: Optional[LabelIndex] = label_index
+        self.indexes: Dict[str, ColumnIndex] = indexes if indexes is not None else {}
+        self._labels = None
+        self._equals = {}
+        self._ranges = {}
+
+    def _with(self, **changes) -> 'IssueQuery':
+        query = IssueQuery(self.issues_df, self.label_index, self.indexes)
+        query._labels = self._labels
+        query._equals = dict(self._equals)
+        query._ranges = dict(self._ranges)
+        for name, value in changes.items():
+            setattr(query, name, value)
+        return query
+
+    @staticmethod
+    def _values(value) -> tuple:
+        return tuple(value) if isinstance(value, (list, tuple, set)) else (value,)
+
+    def _equal(self, column: str, value) -> 'IssueQuery':
+        if value is None:
+            return self
+        values = self._values(value)
+        if column in self.NORMALIZED_COLUMNS:
+            values = tuple(v.strip().lower() if isinstance(v, str) else v for v in values)
+        return self._with(_equals={**self._equals, column: values})
+
+    def label(self, label) -> 'IssueQuery':
+        """
+        Keeps the issues carrying the label, or any of a list of labels.
+        """
+        return self if label is None else self._with(_labels=self._values(label))
+
+    def creator(self, creator: str) -> 'IssueQuery':
+        """
+        Keeps the issues opened by creator.
+        """
+        return self._equal('creator', creator)
+
+    def state(self, state: str) -> 'IssueQuery':
+        """
+        Keeps the issues in the given state, e.g. 'open' or 'closed'.
+        """
+        return self._equal('state', state)
+
+    def closed_by(self, closed_by: str) -> 'IssueQuery':
+        """
+        Keeps the issues closed by the given user.
+        """
+        return self._equal('closed_by', closed_by)
+
+    def between(self, since=None, until=None, column: str = 'created_at') -> 'IssueQuery':
+        """
+        Keeps the issues whose column (created_at by default) is at or after
+        since and before until. Either bound may be left out.
+        """
+        if since is None and until is None:
+            return self
+        return self._with(_ranges={**self._ranges, column: (since, until)})
+
+    def column_index(self, column: str) -> ColumnIndex:
+        """
+        Returns the index of the column's values, building it on first use.
+        """
+        if column not in self.indexes:
+            self.indexes[column] = ColumnIndex(self.issues_df[column])
+        return self.indexes[column]
+
+    @staticmethod
+    def _union(positions) -> np.ndarray:
+        return positions[0] if len(positions) == 1 else np.unique(np.concatenate(positions))
+
+    def sorted_index(self, column: str) -> SortedIndex:
+        """
+        Returns the sorted index of the date column, building it on first use.
+        """
+        key = f'{column}:sorted'
+        if key not in self.indexes:
+            self.indexes[key] = SortedIndex(self.issues_df[column])
+        return self.indexes[key]
+
+    def _label_positions(self) -> np.ndarray:
+        if self.label_index is not None:
+            return self._union([self.label_index.positions(label) for label in self._labels])
+        # Without an index, labels given as plain strings rather than lists are matched too
+        wanted = set(self._labels)
+        return np.flatnonzero([not wanted.isdisjoint(labels) if isinstance(labels, list) else labels in wanted
+                               for labels in self.issues_df['labels']])
+
+    def positions(self) -> np.ndarray:
+        """
+        Sorted row positions of the issues matching every predicate. The indexed
+        predicates are intersected first, smallest first, and the date ranges are
+        only checked on the rows that are left, or looked up in the sorted index
+        of the column if there are no other predicates.
+        """
+        candidates = [self._union([self.column_index(column).positions(value) for value in values])
+                      for column, values in self._equals.items()]
+        if self._labels is not None:
+            candidates.append(self._label_positions())
+        candidates.sort(key=len)
+
+        positions = candidates[0] if candidates else None
+        for other in candidates[1:]:
+            positions = np.intersect1d(positions, other, assume_unique=True)
+
+        for column, (since, until) in self._ranges.items():
+            if positions is None:
+                positions = self.sorted_index(column).positions(since, until)
+                continue
+            values = self.issues_df[column].iloc[positions]
+            mask = values.notna().to_numpy(copy=True)
+            if since is not None:
+                mask &= (values >= to_timestamp(since, values)).to_numpy()
+            if until is not None:
+                mask &= (values < to_timestamp(until, values)).to_numpy()
+            positions = positions[mask]
+
+        if positions is None:
+            return np.arange(len(self.issues_df))
+        return positions
+
+    def issues(self) -> pd.DataFrame:
+        """
+        The matching issues, one row per issue.
+        """
+        return self.issues_df.iloc[self.positions()]
+
+    def count(self) -> int:
+        """
+        Number of matching issues.
+        """
+        return len(self.positions())
+
+    def explode(self) -> pd.DataFrame:
+        """
+        The matching issues exploded to one row per (issue, label). With a label
+        predicate only the rows of the queried labels are kept.
+        """
+        df = self.issues()
+        if 'labels' in df.columns and df['labels'].apply(lambda x: isinstance(x, list)).any():
+            df = df.explode('labels')
+            if self._labels is not None:
+                df = df[df['labels'].isin(self._labels)]
+        return df
@@ -0,0 +1,134 @@
+"""
+Process-wide store of the processed issues. The issues are loaded and
+processed once on first access and the same DataFrame is then handed to
+every analysis that runs in the same process, along with the events table
+built by the DataLoader in the same load.
+"""
+
+import pandas as pd
+from data_loader import DataLoader
+from event_stats import events_from_issues
+from issue_query import IssueQuery
+from label_index import LabelIndex
+import profiling
+
+_store = None
+
+
+class IssueStore:
+    """
+    Loads the issues on first access and keeps the processed DataFrame
+    for all later callers.
+    """
+
+    def __init__(self, data_loader: DataLoader = None):
+        """
+        Constructor. A DataLoader is created lazily if none is given.
+        """
+        self._data_loader = data_loader
+        self._issues_df: pd.DataFrame = None
+        self._events_df: pd.DataFrame = None
+        self._label_index: LabelIndex = None
+        self._column_indexes = {}
+
+    @classmethod
+    def from_issues(cls, issues_df: pd.DataFrame, events_df: pd.DataFrame = None) -> 'IssueStore':
+        """
+        Creates a store holding already processed issues and, optionally, their events.
+        """
+        store = cls()
+        store._issues_df = issues_df
+        store._events_df = events_df
+        return store
+
+    @property
+    def data_loader(self) -> DataLoader:
+        if self._data_loader is None:
+            self._data_loader = DataLoader()
+        return self._data_loader
+
+    def get_issues(self) -> pd.DataFrame:
+        """
+        Returns the processed issues, loading them on the first call only.
+        Analyses must treat the returned DataFrame as read-only since it is shared.
+        """
+        if self._issues_df is None:
+            self._issues_df = self.data_loader.load_and_process_issues()
+        return self._issues_df
+
+    def get_events(self) -> pd.DataFrame:
+        """
+        Returns the events table of the issues, one row per event with the columns
+        of event_stats.EVENT_COLUMNS. Without a table from the DataLoader, it is
+        built from a raw 'events' column of the issues, if they have one.
+        """
+        if self._events_df is None:
+            issues_df = self.get_issues()
+            events_df = self._data_loader.events_df if self._data_loader is not None else None
+            self._events_df = events_df if isinstance(events_df, pd.DataFrame) else events_from_issues(issues_df)
+        return self._events_df
+
+    def get_label_index(self) -> LabelIndex:
+        """
+        Returns the label index over the processed issues, built once.
+        """
+        if self._label_index is None:
+            issues_df = self.get_issues()
+            with profiling.stage('label_index'):
+                self._label_index = LabelIndex.from_issues(issues_df)
+        return self._label_index
+
+    def query(self) -> IssueQuery:
+        """
+        Returns an empty query over the processed issues. Queries from the same
+        store share the label index and the column indexes they build.
+        """
+        return IssueQuery(self.get_issues(), self.get_label_index(), self._column_indexes)
+
+    def by_repo(self):
+        """
+        Yields a (repo, IssueStore) pair per repository so that every analysis
+        can be run per repository. If only one repository was loaded, this store
+        is yielded with repo None.
+        """
+        issues_df = self.get_issues()
+        if 'repo' not in issues_df.columns:
+            yield None, self
+            return
+        events_df = self.get_events()
+        # Without a repo column the events are rebuilt from each repository's issues instead
+        events_by_repo = None
+        if 'repo' in events_df.columns:
+            events_by_repo = {repo: repo_events_df for repo, repo_events_df in events_df.groupby('repo', observed=True)}
+        for repo, repo_df in issues_df.groupby('repo', sort=True, observed=True):
+            repo_events_df = None
+            if events_by_repo is not None:
+                repo_events_df = events_by_repo.get(repo, events_df.iloc[:0]).reset_index(drop=True)
+            yield repo, IssueStore.from_issues(repo_df.reset_index(drop=True), repo_events_df)
+
+    def clear(self):
+        """
+        Drops the loaded issues so that the next access reloads them.
+        """
+        self._issues_df = None
+        self._events_df = None
+        self._label_index = None
+        self._column_indexes = {}
+
+
+def get_store() -> IssueStore:
+    """
+    Returns the process-wide issue store, creating it on first use.
+    """
+    global _store
+    if _store is None:
+        _store = IssueStore()
+    return _store
+
+
+def reset_store():
+    """
+    Discards the process-wide issue store.
+    """
+    global _store
+    _store = None
@@ -0,0 +1,113 @@
+"""
+Inverted index from label to the positions of the issues carrying it.
+The index is built once from the 'labels' column of the processed issues
+and then answers label lookups and per-label aggregations without
+scanning or exploding the whole DataFrame again.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+class LabelIndex:
+    """
+    Maps every label to the row positions of the issues that have it.
+    """
+
+    def __init__(self, labels: pd.Series):
+        """
+        Constructor. labels is the 'labels' column of the issues DataFrame,
+        holding a list of labels per issue.
+        """
+        label_lists = [value if isinstance(value, list) else [] for value in labels]
+        self.index: pd.Index = labels.index
+        # One entry per (issue, label) pair, i.e. the exploded labels column
+        self.row_positions: np.ndarray = np.repeat(
+            np.arange(len(label_lists)), [len(value) for value in label_lists])
+        codes, uniques = pd.factorize(pd.Series([label for value in label_lists for label in value], dtype=object),
+                                      sort=True)
+        self.codes: np.ndarray = codes
+        self.labels: pd.Index = pd.Index(uniques, dtype=object)
+        self._build_positions()
+
+    def _build_positions(self):
+        """
+        Builds the per-label position arrays, sliced out of one array sorted by label code.
+        """
+        order = np.argsort(self.codes, kind='stable')
+        bounds = np.cumsum(np.bincount(self.codes, minlength=len(self.labels)))
+        self._positions = dict(zip(self.labels, np.split(self.row_positions[order], bounds[:-1])))
+        self._matrix: pd.DataFrame = None
+
+    @classmethod
+    def from_issues(cls, issues_df: pd.DataFrame) -> 'LabelIndex':
+        """
+        Builds the index over the 'labels' column of an issues DataFrame.
+        """
+        if 'labels' not in issues_df.columns:
+            return cls(pd.Series([[]] * len(issues_df), index=issues_df.index, dtype=object))
+        return cls(issues_df['labels'])
+
+    def __len__(self) -> int:
+        """
+        Number of issues covered by the index.
+        """
+        return len(self.index)
+
+    def positions(self, label: str) -> np.ndarray:
+        """
+        Sorted row positions of the issues that have the given label.
+        """
+        return self._positions.get(label, np.empty(0, dtype=int))
+
+    def counts(self) -> pd.Series:
+        """
+        Number of issues per label, most frequent first.
+        """
+        counts = pd.Series(np.bincount(self.codes, minlength=len(self.labels)), index=self.labels)
+        return counts.sort_values(ascending=False, kind='stable')
+
+    def matrix(self) -> pd.DataFrame:
+        """
+        One-hot label matrix with one boolean column per label, aligned with
+        the issues DataFrame. Built on first use.
+        """
+        if self._matrix is None:
+            values = np.zeros((len(self.index), len(self.labels)), dtype=bool)
+            values[self.row_positions, self.codes] = True
+            self._matrix = pd.DataFrame(values, index=self.index, columns=self.labels)
+        return self._matrix
+
+    def subset(self, mask: np.ndarray) -> 'LabelIndex':
+        """
+        Returns the index restricted to the rows where mask is True, with
+        positions relative to the restricted rows.
+        """
+        mask = np.asarray(mask, dtype=bool)
+        keep = mask[self.row_positions]
+        new_positions = np.cumsum(mask) - 1
+
+        subset = LabelIndex.__new__(LabelIndex)
+        subset.index = self.index[mask]
+        subset.row_positions = new_positions[self.row_positions[keep]]
+        subset.codes = self.codes[keep]
+        subset.labels = self.labels
+        subset._build_positions()
+        return subset
+
+    def group(self, values: pd.Series):
+        """
+        Groups per-issue values (aligned with the indexed rows) by label,
+        repeating each issue's value once for every label it carries.
+        Labels without any issue in the index are left out.
+        """
+        pair_values = pd.Series(np.asarray(values)[self.row_positions])
+        pair_labels = self.labels.take(self.codes)
+        return pair_values.groupby(pair_labels, sort=True)
+
+    def aggregate(self, values: pd.Series, func='mean'):
+        """
+        Aggregates per-issue values over the issues of each label. func is
+        anything accepted by GroupBy.agg.
+        """
+        return self.group(values).agg(func)
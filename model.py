@@ -3,12 +3,26 @@ Implements a runtime data model that can be used to access
 the properties contained in the issues JSON.
 """
 
+import sys
+from collections.abc import Sequence
 from typing import List, Dict, Set, Tuple
 from enum import Enum
 from datetime import datetime
 from dateutil import parser
 
 
+def parse_date(date_str: str) -> datetime:
+    """
+    Parses a date string. The ISO-8601 timestamps emitted by GitHub are
+    handled by the fast datetime.fromisoformat, anything else falls back
+    to the much slower general-purpose dateutil parser.
+    """
+    try:
+        return datetime.fromisoformat(date_str)
+    except (ValueError, TypeError):
+        return parser.parse(date_str)
+
+
 class State(str, Enum):
     """
     Whether issue is open or closed.
@@ -17,7 +31,16 @@ class State(str, Enum):
     closed = 'closed'
 
 
+def intern_str(value):
+    """
+    Interns strings that repeat across many issues and events (authors,
+    labels, event types) so that every occurrence shares one object.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
 class Event:
+    __slots__ = ('event_type', 'author', 'event_date', 'label', 'comment')
     
     def __init__(self, jobj:any):
         self.event_type:str = None
@@ -30,17 +53,54 @@ class Event:
             self.from_json(jobj)
     
     def from_json(self, jobj:any):
-        self.event_type = jobj.get('event_type')
-        self.author = jobj.get('author')
+        self.event_type = intern_str(jobj.get('event_type'))
+        self.author = intern_str(jobj.get('author'))
         try:
-            self.event_date = parser.parse(jobj.get('event_date'))
+            self.event_date = parse_date(jobj.get('event_date'))
         except:
             pass
-        self.label = jobj.get('label')
+        self.label = intern_str(jobj.get('label'))
         self.comment = jobj.get('comment')
+
+
+class EventList(Sequence):
+    """
+    Read-only list of an issue's events that keeps the raw JSON events and
+    only builds an Event the first time it is accessed. Taking the length
+    never parses anything.
+    """
+    __slots__ = ('_raw', '_parsed')
+
+    def __init__(self, raw_events: List[dict]):
+        self._raw = raw_events
+        # Allocated on first access so that unread event lists stay small
+        self._parsed: List[Event] = None
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if self._parsed is None:
+            self._parsed = [None] * len(self._raw)
+        event = self._parsed[index]
+        if event is None:
+            event = self._parsed[index] = Event(self._raw[index])
+        return event
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, tuple, EventList)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f'EventList({len(self)} events)'
         
         
 class Issue:
+    __slots__ = ('url', 'creator', 'labels', 'state', 'assignees', 'title', 'text', 'number',
+                 'created_date', 'updated_date', 'timeline_url', '_events')
     
     def __init__(self, jobj:any=None):
         self.url:str = None
@@ -58,11 +118,19 @@ class Issue:
         
         if jobj is not None:
             self.from_json(jobj)
+
+    @property
+    def events(self) -> Sequence:
+        return self._events
+
+    @events.setter
+    def events(self, events: Sequence):
+        self._events = events
     
     def from_json(self, jobj: any):
         self.url = jobj.get('url')
-        self.creator = jobj.get('creator')
-        self.labels = jobj.get('labels', [])
+        self.creator = intern_str(jobj.get('creator'))
+        self.labels = self._intern_list(jobj.get('labels', []))
         
         # Handle state assignment
         state_value = jobj.get('state')
@@ -71,7 +139,7 @@ class Issue:
         else:
             self.state = None  # or a default state, if applicable
         
-        self.assignees = jobj.get('assignees', [])
+        self.assignees = self._intern_list(jobj.get('assignees', []))
         self.title = jobj.get('title')
         self.text = jobj.get('text')
 
@@ -86,13 +154,20 @@ class Issue:
         self.updated_date = self._parse_date(jobj.get('updated_date'))
         
         self.timeline_url = jobj.get('timeline_url')
-        self.events = [Event(jevent) for jevent in jobj.get('events', [])]
+        # Events are only parsed when they are accessed
+        self.events = EventList(jobj.get('events', []))
+
+    def _intern_list(self, values):
+        """Helper method to intern the strings of a JSON list, leaving other values untouched."""
+        if isinstance(values, list):
+            return [intern_str(value) for value in values]
+        return values
 
     def _parse_date(self, date_str):
         """Helper method to parse dates, returning None if parsing fails."""
         if date_str:
             try:
-                return parser.parse(date_str)
+                return parse_date(date_str)
             except (ValueError, TypeError):
                 return None
-        return None
\ No newline at end of file
+        return None
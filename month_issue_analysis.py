@@ -5,9 +5,54 @@ from datetime import datetime
 from dateutil import parser
 
 from data_loader import DataLoader  # Ensure the import is correct
-from model import Issue, Event  # Ensure you have defined these classes appropriately
+import plotting
+import profiling
+from event_stats import EventStats
 import config
 
+PERIODS = ['month', 'year-month']
+
+def monthly_issue_counts(issues_df: pd.DataFrame, period: str = 'month') -> pd.DataFrame:
+    """
+    Counts the opened and closed issues per month. With period 'month' the
+    counts are per calendar month (1-12) across all years, with 'year-month'
+    they are per month of every year between the first and last issue.
+    Returns a DataFrame with 'opened' and 'closed' columns.
+    """
+    if period not in PERIODS:
+        raise ValueError(f"Unknown period '{period}', expected one of {PERIODS}")
+
+    # Invalid dates raise a ValueError here rather than being counted silently
+    created_at = pd.to_datetime(issues_df['created_at'])
+    closed_at = pd.to_datetime(issues_df['closed_at'])[issues_df['state'] == 'closed']
+
+    if period == 'month':
+        opened = created_at.dt.month.value_counts()
+        closed = closed_at.dt.month.value_counts()
+        months = pd.RangeIndex(1, 13)
+    else:
+        opened = _to_month_period(created_at).value_counts()
+        closed = _to_month_period(closed_at).value_counts()
+        observed = opened.index.union(closed.index)
+        if observed.empty:
+            months = pd.PeriodIndex([], freq='M')
+        else:
+            months = pd.period_range(observed.min(), observed.max(), freq='M')
+
+    return pd.DataFrame({
+        'opened': opened.reindex(months, fill_value=0),
+        'closed': closed.reindex(months, fill_value=0),
+    }).astype(int)
+
+
+def _to_month_period(dates: pd.Series) -> pd.Series:
+    """Converts dates to monthly periods, in UTC for timezone-aware dates."""
+    dates = dates.dropna()
+    if dates.dt.tz is not None:
+        dates = dates.dt.tz_convert(None)
+    return dates.dt.to_period('M')
+
+
 class MonthIssueAnalysis:
     """
     Implements an example analysis of GitHub issues and outputs the result of that analysis.
@@ -19,30 +64,30 @@ class MonthIssueAnalysis:
         """
         # Parameter is passed in via command line (--user)
         self.USER: str = config.get_parameter('user')
+        # Parameter is passed in via command line (--period): calendar months or a year-month time series
+        self.PERIOD: str = config.get_parameter('period') or 'month'
 
-    def run(self):
+    @profiling.timed('month_issue_analysis')
+    def run(self, issues_df: pd.DataFrame = None, events_df: pd.DataFrame = None):
         """
         Starting point for this analysis.
         """
-        # Use the DataLoader to load and process issues
-        data_loader = DataLoader()
-        issues_df = data_loader.load_and_process_issues()
+        # Use the DataLoader to load and process issues unless they were passed in, e.g. from a shared IssueStore
+        if issues_df is None:
+            data_loader = DataLoader()
+            issues_df = data_loader.load_and_process_issues()
+            events_df = data_loader.events_df
 
         # Check if issues were loaded correctly
         if issues_df.empty:
             print("No issues found to analyze.")
             return
         
-        # Convert DataFrame to list of Issue objects
-        issues: List[Issue] = [Issue(row.to_dict()) for index, row in issues_df.iterrows()]
-
         ### BASIC STATISTICS
         # Calculate the total number of events for a specific user (if specified in command line args)
-        total_events: int = 0
-        for issue in issues:
-            total_events += len([e for e in issue.events if self.USER is None or e.author == self.USER])
+        total_events: int = EventStats.from_issues(issues_df, events_df).total(author=self.USER)
         
-        output: str = f'Found {total_events} events across {len(issues)} issues'
+        output: str = f'Found {total_events} events across {len(issues_df)} issues'
         if self.USER is not None:
             output += f' for {self.USER}.'
         else:
@@ -50,28 +95,28 @@ class MonthIssueAnalysis:
         print('\n\n' + output + '\n\n')
         ###BAR CHART
         #Display a graph of every months open and closed issues
-        opened_issue_month = []
-        for index, issue in issues_df.iterrows():
-            if issue['created_at'].month:
-                if not pd.isna(issue['created_at'].month):
-                    created_at = issue['created_at'].month
-                    opened_issue_month.append(created_at)
-        closed_issue_month = []
-        for index, issue in issues_df.iterrows():
-            if issue['closed_at'].month and issue.get('state') == 'closed': #and statement to ensure no nan's are appeneded
-                if not pd.isna(issue['closed_at'].month):  
-                    closed_at = issue['closed_at'].month
-                    closed_issue_month.append(closed_at)
+        counts = monthly_issue_counts(issues_df, self.PERIOD)
         
-        if opened_issue_month and closed_issue_month:
-            # Plotting the distribution of resolution times
-            plt.hist([opened_issue_month, closed_issue_month],bins=range(1,14), align='left', edgecolor='black', label= ['Opened Issues','Closed Issues'])
-            plt.title("Distribution of Open/Closed Issues Per Month")
+        if counts['opened'].sum() and counts['closed'].sum():
+            if self.PERIOD == 'year-month':
+                # Plotting the opened and closed issues of every month over time
+                plt.figure(figsize=(12, 6))
+                plt.plot(counts.index.to_timestamp(), counts['opened'], marker='o', label='Opened Issues')
+                plt.plot(counts.index.to_timestamp(), counts['closed'], marker='o', label='Closed Issues')
+                plt.title("Open/Closed Issues Per Month Over Time")
+                plt.xlabel("Month")
+                plt.xticks(rotation=45)
+            else:
+                # Plotting the distribution of opened and closed issues over the calendar months
+                plt.bar(counts.index - 0.2, counts['opened'], width=0.4, edgecolor='black', label='Opened Issues')
+                plt.bar(counts.index + 0.2, counts['closed'], width=0.4, edgecolor='black', label='Closed Issues')
+                plt.title("Distribution of Open/Closed Issues Per Month")
+                plt.xlabel("Months")
+                plt.xticks(range(1,13))
             plt.legend(loc='upper right')
-            plt.xlabel("Months")
             plt.ylabel("Number of Issues")
-            plt.xticks(range(1,13))
-            plt.show()
+            plt.tight_layout()
+            plotting.show('month_opened_closed')
 
 if __name__ == '__main__':
     # Invoke run method when running this module directly
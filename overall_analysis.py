@@ -1,11 +1,14 @@
 from typing import List
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 from datetime import datetime
 from dateutil import parser
 from data_loader import DataLoader  # Ensure the import is correct
+import plotting
+import profiling
 from matplotlib.dates import DateFormatter
-from model import Issue, Event  # Ensure you have defined these classes appropriately
+from event_stats import EventStats
 import config
 import warnings
 
@@ -18,6 +21,34 @@ COLOR_PALETTE = {
     "state_transition": "#2ca02c"
 }
 
+def resolution_times(issues_df: pd.DataFrame) -> pd.Series:
+    """
+    Whole days from creation to close for every closed issue with valid dates,
+    computed as a single vectorised column.
+    """
+    closed_at = issues_df['closed_at']
+    created_at = issues_df['created_at']
+    closed = (issues_df['state'] == 'closed') & created_at.notna() & closed_at.notna()
+    return (closed_at[closed] - created_at[closed]).dt.days
+
+
+def resolution_time_stats(times_to_resolve: pd.Series, bins: int = 20) -> dict:
+    """
+    Summarises resolution times with their count, mean, p50/p90/p99 and a
+    histogram of `bins` bins as a (counts, edges) tuple of NumPy arrays.
+    """
+    days = times_to_resolve.to_numpy(dtype=float)
+    p50, p90, p99 = np.percentile(days, [50, 90, 99])
+    return {
+        'count': len(days),
+        'mean': days.mean(),
+        'p50': p50,
+        'p90': p90,
+        'p99': p99,
+        'histogram': np.histogram(days, bins=bins),
+    }
+
+
 class OverallAnalysis:
     """
     Performs an analysis of GitHub issues and outputs the results.
@@ -29,27 +60,27 @@ class OverallAnalysis:
         """
         self.USER: str = config.get_parameter('user')
 
-    def run(self):
+    @profiling.timed('overall_analysis')
+    def run(self, issues_df: pd.DataFrame = None, events_df: pd.DataFrame = None):
         """
         Main method to start the analysis.
         """
-        # Load and process issues using DataLoader
-        data_loader = DataLoader()
-        issues_df = data_loader.load_and_process_issues()
+        # Load and process issues using DataLoader unless they were passed in, e.g. from a shared IssueStore
+        if issues_df is None:
+            data_loader = DataLoader()
+            issues_df = data_loader.load_and_process_issues()
+            events_df = data_loader.events_df
 
         # Check if any issues were loaded
         if issues_df.empty:
             print("No issues found to analyze.")
             return
         
-        # Convert DataFrame to list of Issue objects
-        issues: List[Issue] = [Issue(row.to_dict()) for _, row in issues_df.iterrows()]
-
         ### BASIC STATISTICS
         # Calculate the total number of events
-        total_events = sum(len(issue.events) for issue in issues)
+        total_events = EventStats.from_issues(issues_df, events_df).total()
         
-        print(f'\n\nFound {total_events} events across {len(issues)} issues.\n\n')
+        print(f'\n\nFound {total_events} events across {len(issues_df)} issues.\n\n')
         
         ### BAR CHART: Top 50 Issue Creators
         top_n = 30
@@ -60,14 +91,16 @@ class OverallAnalysis:
         plt.ylabel("Number of Issues Created")
         plt.xticks(rotation=25, ha="right")  # Rotate x-axis labels for readability
         plt.tight_layout()
-        plt.show()
+        plotting.show('overall_top_creators')
 
         ### PIE CHART: Issue State Distribution
         plt.figure(figsize=(8, 8))
         state_counts = issues_df['state'].value_counts()
+        # A categorical state column also counts states absent from this frame
+        state_counts = state_counts[state_counts > 0]
         state_counts.plot(kind="pie", autopct='%1.1f%%', startangle=140, colors=COLOR_PALETTE["pie"], title="Issue State Distribution")
         plt.ylabel("")  # Hide y-axis label for a cleaner look
-        plt.show()
+        plotting.show('overall_state_distribution')
 
         ### BAR CHART: Top 10 Labels Used
         labels = pd.Series([label for labels in issues_df['labels'] for label in labels])
@@ -79,39 +112,40 @@ class OverallAnalysis:
         plt.ylabel("Frequency")
         plt.xticks(rotation=45, ha="right")
         plt.tight_layout()
-        plt.show()
+        plotting.show('overall_top_labels')
 
         ### HISTOGRAM: Time to Resolution for Closed Issues
-        times_to_resolve = []
-        for index, issue in issues_df.iterrows():
-            if issue['state'] == 'closed' and issue['created_at'] and issue['closed_at']:
-                if not pd.isna(issue['closed_at'].month):
-                    created_at = issue['created_at']
-                    closed_at = issue['closed_at']
-                    times_to_resolve.append((closed_at - created_at).days)
+        times_to_resolve = resolution_times(issues_df)
         
-        if times_to_resolve:
-            avg_time_to_resolve = sum(times_to_resolve) / len(times_to_resolve)
+        if not times_to_resolve.empty:
+            stats = resolution_time_stats(times_to_resolve)
+            avg_time_to_resolve = stats['mean']
             print(f"\nAverage Time to Resolve Issues: {avg_time_to_resolve:.2f} days\n")
+            print(f"Time to Resolve Percentiles: p50 {stats['p50']:.1f}, p90 {stats['p90']:.1f}, "
+                  f"p99 {stats['p99']:.1f} days over {stats['count']} issues\n")
 
-            # Plot distribution of resolution times
+            # Plot distribution of resolution times from the pre-binned counts
+            counts, edges = stats['histogram']
             plt.figure(figsize=(10, 6))
-            plt.hist(times_to_resolve, bins=20, color=COLOR_PALETTE["hist"], edgecolor='black')
+            plt.bar(edges[:-1], counts, width=np.diff(edges), align='edge', color=COLOR_PALETTE["hist"], edgecolor='black')
             plt.title("Distribution of Time to Resolve Issues")
             plt.xlabel("Days to Resolution")
             plt.ylabel("Frequency")
             plt.axvline(avg_time_to_resolve, color='red', linestyle='--', linewidth=1, label=f'Average: {avg_time_to_resolve:.2f} days')
+            plt.axvline(stats['p50'], color='black', linestyle=':', linewidth=1, label=f"Median: {stats['p50']:.1f} days")
+            plt.axvline(stats['p90'], color='gray', linestyle=':', linewidth=1, label=f"90th percentile: {stats['p90']:.1f} days")
             plt.legend()
             plt.tight_layout()
-            plt.show()
+            plotting.show('overall_time_to_resolution')
         else:
             print("No closed issues with valid dates found for time-to-resolution analysis.")
         
         
         warnings.filterwarnings("ignore", message=".*Converting to PeriodArray/Index representation will drop timezone information.*")
-        issues_df['created_date'] = pd.to_datetime(issues_df['created_at'])
-        issues_df['month'] = issues_df['created_date'].dt.to_period('M')
-        monthly_issue_count = issues_df['month'].value_counts().sort_index()
+        # Computed as local series so that a shared issues DataFrame is not modified
+        created_date = pd.to_datetime(issues_df['created_at'])
+        month = created_date.dt.to_period('M')
+        monthly_issue_count = month.value_counts().sort_index()
 
         plt.figure(figsize=(10, 6))
         monthly_issue_count.plot(kind="line", color=COLOR_PALETTE["time_series"], marker='o')
@@ -120,7 +154,7 @@ class OverallAnalysis:
         plt.ylabel("Number of Issues Created")
         plt.xticks(rotation=45)
         plt.tight_layout()
-        plt.show()
+        plotting.show('overall_issues_per_month')
 
 if __name__ == '__main__':
     OverallAnalysis().run()
\ No newline at end of file
@@ -0,0 +1,135 @@
+"""
+Shows the figures produced by the analyses, or renders them to files
+when running headless. In headless mode pyplot runs on the Agg backend
+and every finished figure is pickled and saved by a pool of worker
+processes, so figures are rendered in parallel while the analyses keep
+running.
+
+matplotlib is only imported once a figure is shown or rendered, so that
+the command line can be parsed without loading it.
+"""
+
+import os
+import pickle
+import re
+from typing import List
+
+import config
+import profiling
+
+FORMATS = ['png', 'svg']
+
+_renderer = None
+_configured = False
+_prefix = ''
+
+
+def _pyplot():
+    """
+    Returns matplotlib.pyplot, importing it on first use.
+    """
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def _init_worker():
+    import matplotlib
+    matplotlib.use('Agg')
+
+
+def _render_figure(figure_bytes: bytes, path: str) -> str:
+    """
+    Runs in a worker process: restores a pickled figure and saves it.
+    """
+    figure = pickle.loads(figure_bytes)
+    figure.savefig(path)
+    _pyplot().close(figure)
+    return path
+
+
+class FigureRenderer:
+    """
+    Saves figures to an output directory using a process pool.
+    """
+
+    def __init__(self, output_dir: str, figure_format: str = 'png', workers: int = None):
+        """
+        Constructor
+        """
+        if figure_format not in FORMATS:
+            raise ValueError(f"Unsupported figure format '{figure_format}', expected one of {FORMATS}")
+        self.output_dir: str = output_dir
+        self.figure_format: str = figure_format
+        from concurrent.futures import ProcessPoolExecutor
+        self._pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+        self._futures = []
+        os.makedirs(output_dir, exist_ok=True)
+
+    def save(self, figure, name: str):
+        """
+        Hands the figure to a worker process for rendering and closes it here.
+        """
+        safe_name = re.sub(r'[^A-Za-z0-9_.-]+', '_', name)
+        path = os.path.join(self.output_dir, f'{len(self._futures) + 1:02d}_{safe_name}.{self.figure_format}')
+        self._futures.append(self._pool.submit(_render_figure, pickle.dumps(figure), path))
+        _pyplot().close(figure)
+
+    def finish(self) -> List[str]:
+        """
+        Waits for all figures to be written and returns their paths.
+        """
+        paths = [future.result() for future in self._futures]
+        self._pool.shutdown()
+        return paths
+
+
+def configure(output_dir: str = None, figure_format: str = None, workers: int = None):
+    """
+    Switches to headless rendering into output_dir. Without arguments the
+    settings are read from the config (output_dir, figure_format, render_workers);
+    if no output directory is configured, figures are shown interactively.
+    """
+    global _renderer, _configured
+    _configured = True
+    output_dir = output_dir or config.get_parameter('output_dir')
+    if not output_dir:
+        return
+    figure_format = figure_format or config.get_parameter('figure_format') or 'png'
+    workers = workers or config.get_parameter('render_workers')
+    _pyplot().switch_backend('Agg')
+    _renderer = FigureRenderer(output_dir, figure_format, workers)
+
+
+def set_prefix(prefix: str):
+    """
+    Sets a prefix for the names of the following figures, e.g. the repository
+    they belong to. An empty prefix removes it.
+    """
+    global _prefix
+    _prefix = f'{prefix}_' if prefix else ''
+
+
+def show(name: str):
+    """
+    Shows the current figure, or saves it under the given name when running headless.
+    """
+    if not _configured:
+        configure()
+    plt = _pyplot()
+    with profiling.stage('show'):
+        if _renderer is None:
+            plt.show()
+        else:
+            _renderer.save(plt.gcf(), _prefix + name)
+
+
+def finish() -> List[str]:
+    """
+    Waits until all headless figures are written and returns their paths.
+    """
+    global _renderer, _configured
+    with profiling.stage('render'):
+        paths = _renderer.finish() if _renderer is not None else []
+    _renderer = None
+    _configured = False
+    return paths
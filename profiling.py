@@ -0,0 +1,170 @@
+"""
+Stage timers for the data loading and analysis pipeline. Once profiling is
+enabled (run.py --profile or the 'profile' config parameter), every stage
+wrapped in stage() or decorated with timed() records its wall time, call count
+and resident memory, and finish() writes them as a JSON report. Nested stages
+are reported under '/'-joined names, e.g. 'load/process_issues'. With
+--cprofile the whole run is also recorded by cProfile.
+
+Stages run in worker processes (multi-repository loading, parallel JSON Lines
+parsing, figure rendering) are only timed as a whole from the main process.
+"""
+
+import functools
+import json
+import os
+import platform
+import sys
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+import config
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+DEFAULT_REPORT_PATH = 'profile.json'
+
+_enabled = False
+_report_path: Optional[str] = None
+_profiler = None
+_stages: Dict[str, dict] = {}
+_stack = []
+_metadata = {}
+_started = None
+
+
+def _rss_bytes() -> int:
+    """
+    Returns the resident memory of this process, or 0 if it cannot be read.
+    """
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        return 0
+
+
+def _peak_rss_bytes() -> int:
+    """
+    Returns the peak resident memory of this process, or 0 if it is unknown.
+    """
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def configure(enabled: bool = None, report_path: str = None, cprofile: bool = None):
+    """
+    Enables the stage timers. Without arguments the settings are read from the
+    config (profile, profile_output, cprofile); profiling stays off unless enabled.
+    """
+    global _enabled, _report_path, _profiler, _started
+    enabled = enabled or config.get_parameter('profile')
+    cprofile = cprofile or config.get_parameter('cprofile')
+    if not (enabled or cprofile):
+        return
+    _enabled = True
+    _report_path = report_path or config.get_parameter('profile_output') or DEFAULT_REPORT_PATH
+    _started = time.perf_counter()
+    if cprofile:
+        import cProfile
+        _profiler = cProfile.Profile()
+        _profiler.enable()
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+@contextmanager
+def stage(name: str):
+    """
+    Times the enclosed block as a stage. Does nothing while profiling is off.
+    """
+    if not _enabled:
+        yield
+        return
+    _stack.append(name)
+    full_name = '/'.join(_stack)
+    rss_before = _rss_bytes()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        rss_after = _rss_bytes()
+        _stack.pop()
+        record = _stages.setdefault(full_name, {'calls': 0, 'seconds': 0.0, 'rss_delta_mb': 0.0, 'rss_mb': 0.0})
+        record['calls'] += 1
+        record['seconds'] += elapsed
+        record['rss_delta_mb'] += (rss_after - rss_before) / 2 ** 20
+        record['rss_mb'] = max(record['rss_mb'], rss_after / 2 ** 20)
+
+
+def timed(name: str):
+    """
+    Decorator timing every call of the function as the given stage.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with stage(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def annotate(key: str, value):
+    """
+    Adds a value such as the number of issues to the report, to compare runs
+    over different dataset sizes.
+    """
+    if _enabled:
+        _metadata[key] = value
+
+
+def report() -> dict:
+    """
+    Returns the timings recorded so far.
+    """
+    return {
+        'python': platform.python_version(),
+        'total_seconds': time.perf_counter() - _started if _started is not None else 0.0,
+        'peak_rss_mb': _peak_rss_bytes() / 2 ** 20,
+        **_metadata,
+        'stages': {name: dict(record) for name, record in _stages.items()},
+    }
+
+
+def finish() -> Optional[str]:
+    """
+    Writes the JSON report (and the cProfile statistics next to it as .prof)
+    and resets the timers. Returns the report path, or None if profiling is off.
+    """
+    global _enabled, _profiler, _started
+    if not _enabled:
+        return None
+    if _profiler is not None:
+        _profiler.disable()
+        profile_path = os.path.splitext(_report_path)[0] + '.prof'
+        _profiler.dump_stats(profile_path)
+        import pstats
+        pstats.Stats(_profiler).sort_stats('cumulative').print_stats(20)
+        print(f'Saved cProfile statistics {profile_path}')
+        _profiler = None
+
+    with open(_report_path, 'w') as f:
+        json.dump(report(), f, indent=2)
+    _enabled = False
+    _started = None
+    _stages.clear()
+    _metadata.clear()
+    return _report_path
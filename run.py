@@ -6,13 +6,53 @@ the command line to run the analyses.
 """
 
 import argparse
+import sys
 
 import config
-from overall_analysis import OverallAnalysis
-from month_issue_analysis import MonthIssueAnalysis
-from issue_close_time_analysis import IssueCloseTimeAnalysis
-from data_loader import DataLoader
-from analysis import Analysis
+import plotting
+import profiling
+
+
+def parse_features(value):
+    """
+    Parses the --feature flag, which is a single feature number, a comma
+    separated list of feature numbers, or 'all' to run every feature.
+    """
+    if value.strip().lower() == 'all':
+        return list(FEATURES)
+    try:
+        return [int(feature) for feature in value.split(',') if feature.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid feature list: '{value}'")
+
+def parse_names(value):
+    """
+    Parses the --user and --label flags, which are a single name, a comma
+    separated list of names, or @path to a file with one name per line.
+    """
+    if not value:
+        return []
+    if isinstance(value, list):
+        return value
+    if value.startswith('@'):
+        with open(value[1:]) as f:
+            return [line.strip() for line in f if line.strip() and not line.startswith('#')]
+    return [name.strip() for name in value.split(',') if name.strip()]
+
+def parse_date_flag(value):
+    """
+    Checks the --since and --until flags, which are an ISO date or timestamp
+    or a number of days ago such as '90d', so that a malformed date is a usage
+    error rather than a failure after the analyses started. The flag is kept
+    as given and parsed again by the DataLoader.
+    """
+    # Only imported, together with pandas, when a date was given
+    from data_loader import parse_date_bound
+    try:
+        parse_date_bound(value)
+    except (ValueError, OverflowError):
+        raise argparse.ArgumentTypeError(f"invalid date: '{value}'")
+    return value
 
 def parse_args():
     """
@@ -27,52 +67,190 @@ def parse_args():
     ap = argparse.ArgumentParser("run.py")
     
     # Required parameter specifying what analysis to run
-    ap.add_argument('--feature', '-f', type=int, required=True,
-                    help='Which of the three features to run')
+    ap.add_argument('--feature', '-f', type=parse_features, required=True,
+                    help="Which feature to run, a comma separated list of features, or 'all'")
     
-    # Optional parameter for analyses focusing on a specific user (i.e., contributor)
+    # Optional parameter for analyses focusing on a specific user (i.e., contributor),
+    # or on several users with one report each
     ap.add_argument('--user', '-u', type=str, required=False,
-                    help='Optional parameter for analyses focusing on a specific user')
+                    help='Optional parameter for analyses focusing on a specific user, '
+                         'a comma separated list of users or @file with one user per line')
     
-    # Optional parameter for analyses focusing on a specific label
+    # Optional parameter for analyses focusing on a specific label, or on several labels
     ap.add_argument('--label', '-l', type=str, required=False,
-                    help='Optional parameter for analyses focusing on a specific label')
+                    help='Optional parameter for analyses focusing on a specific label, '
+                         'a comma separated list of labels or @file with one label per line')
+    
+    # Optional parameter to stream the issues file and process it in chunks of this many issues
+    ap.add_argument('--chunk-size', type=int, required=False,
+                    help='Optional parameter to stream large issue files in chunks of this many issues')
+    
+    # Optional parameter to cache the processed issues between runs
+    ap.add_argument('--cache-dir', type=str, required=False,
+                    help='Optional directory where the processed issues are cached between runs')
+    
+    # Optional parameter to only process issues updated since the cached snapshot
+    ap.add_argument('--incremental', action='store_true', default=None,
+                    help='Optional flag to merge only new and updated issues into the cached snapshot (requires --cache-dir)')
+    
+    # Optional parameter to store the processed issues with compact dtypes
+    ap.add_argument('--optimize-dtypes', action='store_true', default=None,
+                    help='Optional flag to store creator, state and closed_by as categoricals to reduce memory use')
+    
+    # Optional parameters to time every stage of the run and write a JSON report
+    ap.add_argument('--profile', action='store_true', default=None,
+                    help='Optional flag to time every loading and analysis stage and write a JSON report')
+    ap.add_argument('--profile-output', type=str, required=False,
+                    help='Optional path of the JSON profiling report, profile.json by default')
+    ap.add_argument('--cprofile', action='store_true', default=None,
+                    help='Optional flag to also record the run with cProfile, saved next to the report as .prof')
+    
+    # Optional parameters limiting every analysis to the issues created in a period; the issues
+    # outside of it are skipped while loading
+    ap.add_argument('--since', type=parse_date_flag, required=False,
+                    help="Optional start of the period (inclusive) as an ISO date or timestamp, or e.g. '90d' for 90 days ago")
+    ap.add_argument('--until', type=parse_date_flag, required=False,
+                    help="Optional end of the period (exclusive) as an ISO date or timestamp, or e.g. '30d' for 30 days ago")
+    
+    # Optional parameters for analysing the issues of several repositories
+    ap.add_argument('--by-repo', action='store_true', default=None,
+                    help='Optional flag to run every feature separately for each configured repository')
+    ap.add_argument('--load-workers', type=int, required=False,
+                    help='Optional number of processes loading the issue files of several repositories')
+    
+    # Optional parameter for the monthly analysis to plot every month of every year instead of calendar months
+    ap.add_argument('--period', type=str, choices=['month', 'year-month'], required=False,
+                    help="Optional grouping for the monthly analysis: 'month' (default) or 'year-month'")
+    
+    # Optional parameters to render every figure to files instead of showing them
+    ap.add_argument('--output-dir', '-o', type=str, required=False,
+                    help='Optional directory to save figures to instead of showing them (headless mode)')
+    ap.add_argument('--format', dest='figure_format', type=str, choices=plotting.FORMATS, required=False,
+                    help='Optional file format of the saved figures, png by default')
+    ap.add_argument('--render-workers', type=int, required=False,
+                    help='Optional number of processes rendering figures in headless mode')
     
     return ap.parse_args()
 
 
+# The analysis modules, and pandas and matplotlib with them, are imported by the
+# feature that needs them, so that parsing and validating the arguments stays fast
+
+def run_overall(store):
+    from overall_analysis import OverallAnalysis
+    OverallAnalysis().run(store.get_issues(), store.get_events()) #Analysis of labels
+
+
+def run_user_label(store):
+    from analysis import Analysis
+    labels = parse_names(args.label or config.get_parameter('label'))
+    users = user_names or parse_names(config.get_parameter('creator'))
+    df = store.get_issues()  # This loads your issues data, once per process
+
+    # Initialize the Analysis object
+    analysis = Analysis()  
+
+    if len(users) > 1:
+        # One report per user, all computed from a single aggregation over the issues
+        analysis.analyze_users(df, users, labels or None, query=store.query())
+        return
+
+    # Filter the issues based on the provided label(s) and creator
+    label = labels[0] if len(labels) == 1 else labels or None
+    user = users[0] if users else None
+    filtered_df = analysis.filter_issues(df, label=label, creator=user, query=store.query())
+
+    # Perform the analysis and visualization on the filtered issues
+    analysis.analyze_and_visualize(filtered_df, df)
+
+
+def run_monthly(store):
+    from month_issue_analysis import MonthIssueAnalysis
+    MonthIssueAnalysis().run(store.get_issues(), store.get_events()) #Analysis of opened and closed tickets based on months
+
+
+def run_close_time(store):
+    from issue_close_time_analysis import IssueCloseTimeAnalysis
+    IssueCloseTimeAnalysis().run(store.get_issues(), store.get_label_index()) #Analysis of average time it takes to close various issue types
+
+
+# Registry of the features selectable with --feature
+FEATURE_RUNNERS = {
+    0: run_overall,
+    1: run_user_label,
+    2: run_monthly,
+    3: run_close_time,
+}
+FEATURES = list(FEATURE_RUNNERS)
+
+
+def check_feature(feature):
+    """
+    Checks that a feature exists and has the arguments it needs, before any
+    data is loaded.
+    """
+    if feature not in FEATURE_RUNNERS:
+        print('Need to specify which feature to run with --feature flag.')
+        return False
+    if feature == 1 and args.label == None and not user_names:
+        # Calling Feature1Analysis needs at least one of the optional filters
+        print("Please provide a --user or --label argument")
+        return False
+    return True
+
+
+def run_feature(feature, store):
+    """
+    Runs a single feature on the issues held by the shared store, so that
+    running several features in one process loads the data only once.
+    """
+    FEATURE_RUNNERS[feature](store)
+
 
 # Parse feature to call from command line arguments
 args = parse_args()
+# --user may name several users, which only feature 1 reports on one by one. The names are
+# parsed once here and the analyses focusing on a single user through the config only get
+# the user when exactly one was given
+user_names = parse_names(args.user)
+args.user = user_names[0] if len(user_names) == 1 else None
 # Add arguments to config so that they can be accessed in other parts of the application
 config.overwrite_from_args(args)
-    
-# Run the feature specified in the --feature flag
-if args.feature == 0:
-    OverallAnalysis().run() #Analysis of labels
-elif args.feature == 1:
-    # Calling Feature1Analysis with optional filters if provided
-    if args.label == None and args.user == None:
-        print("Please provide a --user or --label argument")
-    else:
-        label = args.label or config.get_parameter('label')  
-        user = args.user or config.get_parameter('creator')  
-        data_loader = DataLoader()
-        df = data_loader.load_and_process_issues()  # This loads your issues data
-    
-    # Initialize the Analysis object
-        analysis = Analysis()  
-    
-    # Filter the issues based on the provided label and creator
-        filtered_df = analysis.filter_issues(df, label=label, creator=user)
-    
-    # Perform the analysis and visualization on the filtered issues
-        analysis.analyze_and_visualize(filtered_df, df)
-    # Initialize the DataLoader and load the DataFrame
-    
-elif args.feature == 2:
-    MonthIssueAnalysis().run() #Analysis of opened and closed tickets based on months
-elif args.feature == 3:
-    IssueCloseTimeAnalysis().run() #Analysis of average time it takes to close various issue types
+
+# Skip the features that cannot run before anything is imported or loaded
+features = [feature for feature in args.feature if check_feature(feature)]
+if not features:
+    sys.exit()
+
+# Stage timers stay off unless --profile was given
+profiling.configure()
+
+# Figures are shown interactively unless an output directory was given
+plotting.configure()
+
+# Run the features specified in the --feature flag over a single shared load
+from issue_store import get_store
+store = get_store()
+if args.by_repo:
+    # Run every feature once per repository, on that repository's issues only
+    for repo, repo_store in store.by_repo():
+        if repo is not None:
+            print(f'\n\n===== Repository {repo} =====\n')
+        plotting.set_prefix(repo)
+        for feature in features:
+            run_feature(feature, repo_store)
+    plotting.set_prefix(None)
 else:
-    print('Need to specify which feature to run with --feature flag.')
+    for feature in features:
+        run_feature(feature, store)
+
+# Wait for headless figures to be written
+for path in plotting.finish():
+    print(f'Saved figure {path}')
+
+# Write the timing report
+if profiling.is_enabled():
+    profiling.annotate('issues', len(store.get_issues()))
+report_path = profiling.finish()
+if report_path:
+    print(f'Saved profiling report {report_path}')
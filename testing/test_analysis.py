@@ -84,6 +84,34 @@ class TestAnalysis(unittest.TestCase):
             analysis.analyze_and_visualize(filtered_df, self.mock_df)
             mock_show.assert_called()
 
+    def test_aggregate_by_user_label(self):
+        analysis=Analysis()
+        counts=analysis.aggregate_by_user_label(self.mock_df, users=["dbrtly", "srittau"])
+        self.assertEqual(counts.loc[("dbrtly", "kind/bug")].tolist(), [1, 1, 5])
+        self.assertEqual(counts.loc[("srittau", "area/docs")].tolist(), [1, 0, 0])
+        self.assertEqual(counts["opened_count"].sum(), 4)
+
+    def test_analyze_users_matches_single_user_reports(self):
+        """Every user's batch report prints what a separate single-user run prints."""
+        analysis=Analysis()
+        users=["dbrtly", "srittau", "nobody"]
+        with patch("plotting.show"), patch("builtins.print") as mock_print:
+            analysis.analyze_users(self.mock_df, users)
+            batch=[c for c in mock_print.call_args_list if not c.args[0].startswith("\n=====")]
+        with patch("plotting.show"), patch("builtins.print") as mock_print:
+            for user in users:
+                filtered_df=analysis.filter_issues(self.mock_df, creator=user)
+                analysis.analyze_and_visualize(filtered_df, self.mock_df)
+            single=[c for c in mock_print.call_args_list if not c.args[0].startswith("Filtered")]
+        self.assertEqual(batch, single)
+
+    def test_analyze_users_with_labels(self):
+        analysis=Analysis()
+        with patch("plotting.show") as mock_show, patch("builtins.print") as mock_print:
+            analysis.analyze_users(self.mock_df, ["dbrtly", "srittau"], labels=["status/triage"])
+            mock_print.assert_any_call("Unique labels used by srittau: ['status/triage']")
+            self.assertEqual(mock_show.call_count, 4)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,531 @@
+import bz2
+import gzip
+import json
+import lzma
+import os
+import tempfile
+import tracemalloc
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pandas as pd
+from issue_close_time_analysis import IssueCloseTimeAnalysis
+from data_loader import (DataLoader, detect_compression, in_date_window, is_json_lines, memory_per_issue,
+                         optimize_dtypes, parse_date_bound)
+from event_stats import EventStats
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+def make_issue(number, state='closed'):
+    return {
+        'url': f'https://github.com/python-poetry/poetry/issues/{number}',
+        'creator': f'user{number % 7}',
+        'labels': ['kind/bug', 'status/triage'] if number % 2 else ['area/docs'],
+        'state': state,
+        'title': f' Issue {number} ',
+        'text': 'x' * 1000,
+        'number': number,
+        'created_date': '2023-01-01T10:00:00+00:00',
+        'updated_date': '2023-01-05T10:00:00+00:00',
+        'events': [
+            {'event_type': 'labeled', 'author': 'bot', 'event_date': '2023-01-01T11:00:00+00:00', 'label': 'kind/bug'},
+            {'event_type': 'closed', 'author': ' Maintainer ', 'event_date': '2023-01-04T10:00:00+00:00'},
+        ] if state == 'closed' else [],
+    }
+
+
+class TestDataLoader(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.data_path = os.path.join(self.tmpdir.name, 'issues.json')
+        self.config_path = os.path.join(self.tmpdir.name, 'config.json')
+        with open(self.config_path, 'w') as f:
+            json.dump({'file_path': self.data_path}, f)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def write_issues(self, issues, indent=None):
+        with open(self.data_path, 'w') as f:
+            json.dump(issues, f, indent=indent)
+
+    def test_iter_issues_matches_json_load(self):
+        """Streaming yields the same issues as loading the whole array."""
+        issues = [make_issue(n, 'closed' if n % 3 else 'open') for n in range(50)]
+        self.write_issues(issues, indent=2)
+        loader = DataLoader(self.config_path)
+        self.assertEqual(list(loader.iter_issues(buffer_size=64)), issues)
+
+    def test_iter_issues_empty_array(self):
+        self.write_issues([])
+        loader = DataLoader(self.config_path)
+        self.assertEqual(list(loader.iter_issues()), [])
+
+    def test_iter_issue_chunks_sizes(self):
+        self.write_issues([make_issue(n) for n in range(25)])
+        loader = DataLoader(self.config_path)
+        sizes = [len(chunk) for chunk in loader.iter_issue_chunks(10)]
+        self.assertEqual(sizes, [10, 10, 5])
+
+    def test_streaming_load_matches_full_load(self):
+        """Chunked processing produces the same frame, including cross-chunk duplicates."""
+        issues = [make_issue(n, 'closed' if n % 3 else 'open') for n in range(40)]
+        issues.append(make_issue(3))
+        self.write_issues(issues)
+        full_df = DataLoader(self.config_path).load_and_process_issues()
+        streamed_df = DataLoader(self.config_path, chunk_size=7).load_and_process_issues()
+        pd.testing.assert_frame_equal(streamed_df, full_df)
+
+    def streaming_peak_memory(self, n_issues, chunk_size):
+        self.write_issues([make_issue(n) for n in range(n_issues)])
+        loader = DataLoader(self.config_path)
+        tracemalloc.start()
+        try:
+            count = sum(len(chunk) for chunk in loader.iter_issue_chunks(chunk_size))
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(count, n_issues)
+        return peak
+
+    def test_streaming_memory_is_bounded(self):
+        """Peak memory while streaming depends on the chunk size, not the file size."""
+        small_peak = self.streaming_peak_memory(1000, chunk_size=50)
+        large_peak = self.streaming_peak_memory(8000, chunk_size=50)
+        file_size = os.path.getsize(self.data_path)
+
+        self.assertLess(large_peak, file_size / 10)
+        self.assertLess(large_peak, small_peak * 1.5)
+
+    def test_process_issues_matches_rowwise(self):
+        """The column-wise path gives the same frame as the row-wise reference."""
+        issues = [make_issue(n, 'closed' if n % 3 else 'open') for n in range(30)]
+        issues.append(make_issue(4))
+        issues.append({'number': None, 'state': 'closed', 'title': 'No number'})
+        issues.append({'number': 100, 'state': ' Closed', 'labels': None, 'events': [
+            {'event_type': 'closed', 'author': 'First', 'event_date': '2023-02-01T00:00:00+00:00'},
+            {'event_type': 'reopened', 'author': 'other', 'event_date': '2023-02-02T00:00:00+00:00'},
+            {'event_type': 'closed', 'author': 'Second', 'event_date': '2023-02-03T00:00:00+00:00'},
+        ]})
+        loader = DataLoader(self.config_path)
+        pd.testing.assert_frame_equal(loader.process_issues(issues), loader.process_issues_rowwise(issues))
+
+    def test_processed_issues_keep_events(self):
+        """The events of the processed issues can be counted without going back to the raw issues."""
+        issues = [make_issue(n, 'closed' if n % 3 else 'open') for n in range(30)]
+        loader = DataLoader(self.config_path)
+        df = loader.process_issues(issues)
+        events_df = loader.process_events(issues)
+        self.assertNotIn('events', df.columns)
+        stats = EventStats.from_issues(df, events_df)
+        self.assertEqual(stats.total(), sum(len(issue['events']) for issue in issues))
+        self.assertEqual(stats.total(author='bot'), 20)
+
+    def test_reopened_issues(self):
+        """The closing event is the last close after the last reopen, with reopens and open time recorded."""
+        def event(event_type, day, author=None):
+            return {'event_type': event_type, 'author': author, 'event_date': f'2023-01-{day:02d}T00:00:00+00:00'}
+        issues = [
+            dict(make_issue(1), events=[event('closed', 3, 'First'), event('reopened', 5), event('closed', 9, 'Second')]),
+            dict(make_issue(2), events=[event('closed', 3, 'First'), event('reopened', 4)]),
+            dict(make_issue(3, 'open'), events=[event('closed', 2, 'First'), event('reopened', 3)]),
+            dict(make_issue(4), events=[event('labeled', 2), event('closed', 6, 'Only')]),
+        ]
+        loader = DataLoader(self.config_path)
+        df = loader.process_issues(issues).set_index('number')
+
+        self.assertEqual(df.loc[1, 'closed_by'], 'second')
+        self.assertTrue(pd.isna(df.loc[2, 'closed_by']))
+        self.assertEqual(df.loc[1, 'closed_at'], pd.Timestamp('2023-01-09', tz='UTC'))
+        self.assertTrue(pd.isna(df.loc[2, 'closed_at']))
+        self.assertEqual(df['reopen_count'].tolist(), [1, 1, 1, 0])
+        # Created on the 1st, closed from the 3rd to the 5th, finally closed on the 9th
+        self.assertEqual(df.loc[1, 'open_duration'], pd.Timedelta(days=8) - pd.Timedelta(hours=10) - pd.Timedelta(days=2))
+        self.assertEqual(df.loc[4, 'open_duration'], pd.Timedelta(days=5) - pd.Timedelta(hours=10))
+        self.assertTrue(df.loc[[2, 3], 'open_duration'].isna().all())
+        pd.testing.assert_frame_equal(loader.process_issues(issues), loader.process_issues_rowwise(issues))
+
+    def test_naive_timestamps(self):
+        """Timestamps without an offset are taken as UTC, so close times can be computed from them."""
+        issues = [make_issue(n, 'closed' if n % 3 else 'open') for n in range(12)]
+        for issue in issues:
+            issue['created_date'] = issue['created_date'][:19]
+            issue['updated_date'] = issue['updated_date'][:19]
+            for event in issue['events']:
+                event['event_date'] = event['event_date'][:19]
+        self.write_issues(issues)
+        loader = DataLoader(self.config_path)
+        df = loader.load_and_process_issues()
+        for frame in [df, loader.process_issues_rowwise(issues)]:
+            for column in ['created_at', 'updated_at', 'closed_at']:
+                self.assertEqual(str(frame[column].dt.tz), 'UTC')
+        self.assertEqual((df['closed_at'] - df['created_at']).dropna().dt.days.unique().tolist(), [3])
+
+        with patch('plotting.show') as mock_show, patch('builtins.print') as mock_print:
+            IssueCloseTimeAnalysis().run(df)
+        mock_show.assert_called_once()
+        printed = [call.args[0] for call in mock_print.call_args_list if call.args]
+        self.assertIn("Average Close Time for label 'kind/bug': 3 days", '\n'.join(printed))
+
+    def test_process_issues_empty(self):
+        loader = DataLoader(self.config_path)
+        with patch('builtins.print') as mock_print:
+            self.assertTrue(loader.process_issues([]).empty)
+            mock_print.assert_called_once_with("Empty DataFrame after processing.")
+
+    def test_cache_warm_start_skips_processing(self):
+        """A second load of an unchanged file is served from the cache."""
+        self.write_issues([make_issue(n) for n in range(10)])
+        cache_dir = os.path.join(self.tmpdir.name, 'cache')
+        cold_df = DataLoader(self.config_path, cache_dir=cache_dir).load_and_process_issues()
+
+        with patch.object(DataLoader, 'process_issues') as mock_process:
+            warm_df = DataLoader(self.config_path, cache_dir=cache_dir).load_and_process_issues()
+            mock_process.assert_not_called()
+        pd.testing.assert_frame_equal(warm_df, cold_df)
+
+    def test_cache_invalidated_when_source_changes(self):
+        self.write_issues([make_issue(n) for n in range(10)])
+        cache_dir = os.path.join(self.tmpdir.name, 'cache')
+        DataLoader(self.config_path, cache_dir=cache_dir).load_and_process_issues()
+
+        self.write_issues([make_issue(n) for n in range(12)])
+        df = DataLoader(self.config_path, cache_dir=cache_dir).load_and_process_issues()
+        self.assertEqual(len(df), 12)
+
+    def test_cache_key_taken_before_parsing(self):
+        """A file changed while it is parsed is not served from the cache built from its old content."""
+        self.write_issues([make_issue(n) for n in range(10)])
+        cache_dir = os.path.join(self.tmpdir.name, 'cache')
+        load_issues = DataLoader.load_issues
+
+        def load_then_change(loader):
+            issues = load_issues(loader)
+            self.write_issues([make_issue(n) for n in range(12)])
+            return issues
+
+        with patch.object(DataLoader, 'load_issues', load_then_change):
+            self.assertEqual(len(DataLoader(self.config_path, cache_dir=cache_dir).load_and_process_issues()), 10)
+        self.assertEqual(len(DataLoader(self.config_path, cache_dir=cache_dir).load_and_process_issues()), 12)
+
+    def test_incremental_update_processes_only_changes(self):
+        """Only new and updated issues are processed and upserted into the snapshot."""
+        issues = [dict(make_issue(n, 'open'), updated_date=f'2023-01-{n + 1:02d}T10:00:00+00:00') for n in range(10)]
+        self.write_issues(issues)
+        cache_dir = os.path.join(self.tmpdir.name, 'cache')
+        DataLoader(self.config_path, cache_dir=cache_dir).load_and_process_issues()
+
+        issues[3] = dict(make_issue(3, 'closed'), updated_date='2023-02-01T10:00:00+00:00')
+        issues.append(dict(make_issue(10, 'open'), updated_date='2023-02-02T10:00:00+00:00'))
+        self.write_issues(issues)
+
+        loader = DataLoader(self.config_path, cache_dir=cache_dir, incremental=True)
+        with patch.object(DataLoader, 'process_issues', wraps=loader.process_issues) as mock_process:
+            with patch('builtins.print'):
+                df = loader.load_and_process_issues()
+            processed = mock_process.call_args[0][0]
+        # Issue 9 was updated exactly at the snapshot's newest time, so it is re-checked too
+        self.assertEqual(sorted(issue['number'] for issue in processed), [3, 9, 10])
+
+        expected = DataLoader(self.config_path).load_and_process_issues()
+        pd.testing.assert_frame_equal(df.sort_values('number').reset_index(drop=True),
+                                      expected.sort_values('number').reset_index(drop=True))
+
+        # The merged result is persisted for the next run
+        with patch.object(DataLoader, 'process_issues') as mock_process:
+            cached = DataLoader(self.config_path, cache_dir=cache_dir).load_and_process_issues()
+            mock_process.assert_not_called()
+        self.assertEqual(len(cached), 11)
+
+    def test_multiple_repositories(self):
+        """A glob of files is loaded in parallel into one frame with a repo column."""
+        repos_dir = os.path.join(self.tmpdir.name, 'repos')
+        os.makedirs(repos_dir)
+        for name, count in [('poetry', 3), ('pip', 2)]:
+            with open(os.path.join(repos_dir, f'{name}.json'), 'w') as f:
+                json.dump([make_issue(n) for n in range(count)], f)
+        with open(self.config_path, 'w') as f:
+            json.dump({'file_path': os.path.join(repos_dir, '*.json')}, f)
+
+        df = DataLoader(self.config_path, workers=2).load_and_process_issues()
+        self.assertEqual(df.groupby('repo').size().to_dict(), {'pip': 2, 'poetry': 3})
+        self.assertEqual(df['number'].tolist(), [0, 1, 0, 1, 2])
+
+    def test_repository_mapping(self):
+        loader = DataLoader(file_path={'python-poetry/poetry': 'poetry.json', 'pypa/pip': 'pip.json'})
+        self.assertEqual(loader.sources, {'python-poetry/poetry': 'poetry.json', 'pypa/pip': 'pip.json'})
+
+    def test_repo_names(self):
+        loader = DataLoader(file_path=['a/poetry_issues.json.gz', 'c/pip.v2.jsonl', 'c/pip.v2.jsonl'])
+        self.assertEqual(loader.sources, {'poetry_issues': 'a/poetry_issues.json.gz', 'pip.v2': 'c/pip.v2.jsonl'})
+
+    def test_duplicate_repo_names(self):
+        """Two files named after the same repository are an error rather than loaded twice."""
+        for paths in (['data/pip_issues.json', 'data/pip_issues.json.gz'], ['a/pip.json', 'b/pip.json']):
+            with self.assertRaisesRegex(ValueError, "both named 'pip"):
+                DataLoader(file_path=paths)
+
+    def check_compressed(self, opener, extension):
+        issues = [make_issue(n, 'closed' if n % 3 else 'open') for n in range(30)]
+        self.write_issues(issues)
+        expected = DataLoader(self.config_path).load_and_process_issues()
+
+        compressed_path = self.data_path + extension
+        with open(self.data_path, 'rb') as fin, opener(compressed_path) as fout:
+            fout.write(fin.read())
+        loader = DataLoader(file_path=compressed_path)
+        pd.testing.assert_frame_equal(loader.load_and_process_issues(), expected)
+        self.assertEqual(list(loader.iter_issues(buffer_size=100)), issues)
+
+    def test_gzip_input(self):
+        self.check_compressed(lambda path: gzip.open(path, 'wb'), '.gz')
+
+    def test_xz_input(self):
+        self.check_compressed(lambda path: lzma.open(path, 'wb'), '.xz')
+
+    def test_bz2_input(self):
+        self.check_compressed(lambda path: bz2.open(path, 'wb'), '.bz2')
+
+    @unittest.skipIf(zstandard is None, 'zstandard is not installed')
+    def test_zstd_input(self):
+        self.check_compressed(lambda path: zstandard.open(path, 'wb'), '.zst')
+
+    def test_detect_compression_by_magic_bytes(self):
+        """Compression is detected from the content even with a misleading extension."""
+        path = os.path.join(self.tmpdir.name, 'issues.json')
+        with gzip.open(path, 'wb') as f:
+            f.write(b'[]')
+        self.assertEqual(detect_compression(path), 'gzip')
+        self.write_issues([])
+        self.assertIsNone(detect_compression(self.data_path))
+
+    def write_json_lines(self, issues, path):
+        with open(path, 'w') as f:
+            for issue in issues:
+                f.write(json.dumps(issue) + '\n')
+
+    def test_json_lines_input(self):
+        """A JSON Lines file loads to the same frame as the equivalent JSON array."""
+        issues = [make_issue(n, 'closed' if n % 3 else 'open') for n in range(30)]
+        self.write_issues(issues)
+        expected = DataLoader(self.config_path).load_and_process_issues()
+
+        jsonl_path = os.path.join(self.tmpdir.name, 'issues.jsonl')
+        self.write_json_lines(issues, jsonl_path)
+        loader = DataLoader(file_path=jsonl_path)
+        self.assertEqual(loader.load_issues(), issues)
+        pd.testing.assert_frame_equal(loader.load_and_process_issues(), expected)
+        pd.testing.assert_frame_equal(DataLoader(file_path=jsonl_path, chunk_size=7).load_and_process_issues(), expected)
+
+    def test_is_json_lines(self):
+        self.write_issues([make_issue(1)])
+        self.assertFalse(is_json_lines(self.data_path))
+        sniffed_path = os.path.join(self.tmpdir.name, 'issues.txt')
+        self.write_json_lines([make_issue(1)], sniffed_path)
+        self.assertTrue(is_json_lines(sniffed_path))
+
+    def test_json_lines_parallel_matches_serial(self):
+        """Byte-range shards give the same frame as a serial load, including duplicates across shards."""
+        issues = [make_issue(n, 'closed' if n % 3 else 'open') for n in range(60)]
+        issues.append(make_issue(2))
+        jsonl_path = os.path.join(self.tmpdir.name, 'issues.jsonl')
+        self.write_json_lines(issues, jsonl_path)
+
+        serial_df = DataLoader(file_path=jsonl_path).process_issues(issues)
+        parallel_df = DataLoader(file_path=jsonl_path, workers=4).load_and_process_issues()
+        pd.testing.assert_frame_equal(parallel_df, serial_df)
+
+    def test_convert_to_json_lines(self):
+        issues = [make_issue(n) for n in range(20)]
+        self.write_issues(issues, indent=2)
+        loader = DataLoader(self.config_path)
+        for name in ['issues.jsonl', 'issues.jsonl.xz']:
+            target_path = os.path.join(self.tmpdir.name, name)
+            self.assertEqual(loader.convert_to_json_lines(target_path), 20)
+            self.assertEqual(DataLoader(file_path=target_path).load_issues(), issues)
+
+    def test_optimize_dtypes(self):
+        """The compact schema keeps every value while using less memory."""
+        issues = json.loads(json.dumps([make_issue(n, 'closed' if n % 3 else 'open') for n in range(200)]))
+        df = DataLoader(self.config_path).process_issues(issues)
+        optimized = optimize_dtypes(df)
+
+        for column in ['creator', 'state', 'closed_by']:
+            self.assertIsInstance(optimized[column].dtype, pd.CategoricalDtype)
+        self.assertEqual(optimized['number'].dtype, 'int32')
+        self.assertIs(optimized['labels'].iloc[1][0], optimized['labels'].iloc[3][0])
+        pd.testing.assert_frame_equal(optimized.astype(object), df.astype(object), check_dtype=False)
+        self.assertLess(memory_per_issue(optimized), memory_per_issue(df))
+
+    def test_optimize_dtypes_from_loader(self):
+        self.write_issues([make_issue(n) for n in range(10)])
+        with patch('builtins.print'):
+            df = DataLoader(self.config_path, optimize=True).load_and_process_issues()
+        self.assertIsInstance(df['state'].dtype, pd.CategoricalDtype)
+        self.assertEqual(df['number'].tolist(), list(range(10)))
+
+    def check_events(self, loader, df, issues):
+        """The events table holds the events of the processed issues, first copy of duplicates only."""
+        expected = {}
+        for issue in issues:
+            if issue.get('number') is not None:
+                expected.setdefault(issue['number'], [event['event_type'] for event in issue.get('events', [])])
+        events_df = loader.events_df
+        self.assertEqual(list(events_df.columns[:5]), ['issue_number', 'event_type', 'author', 'event_date', 'label'])
+        self.assertEqual(len(events_df), sum(len(expected[number]) for number in df['number']))
+        actual = events_df.groupby('issue_number', sort=False)['event_type'].agg(list).to_dict()
+        self.assertEqual(actual, {number: types for number, types in expected.items() if types})
+
+    def test_events_table(self):
+        issues = [make_issue(n, 'closed' if n % 3 else 'open') for n in range(30)]
+        issues.append(dict(make_issue(4), events=[{'event_type': 'commented', 'author': 'dup'}]))
+        self.write_issues(issues)
+        loader = DataLoader(self.config_path)
+        df = loader.load_and_process_issues()
+        self.check_events(loader, df, issues)
+
+        events_df = loader.events_df
+        self.assertEqual(str(events_df['event_date'].dt.tz), 'UTC')
+        labeled = events_df[events_df['event_type'] == 'labeled']
+        self.assertTrue((labeled['label'] == 'kind/bug').all())
+        self.assertTrue(events_df.loc[events_df['event_type'] == 'closed', 'label'].isna().all())
+
+    def test_events_table_streaming_and_parallel(self):
+        """Chunked and sharded loads build the same events table as a full load."""
+        issues = [make_issue(n, 'closed' if n % 3 else 'open') for n in range(40)]
+        issues.append(dict(make_issue(3), events=[{'event_type': 'commented', 'author': 'dup'}]))
+        self.write_issues(issues)
+        full = DataLoader(self.config_path)
+        full.load_and_process_issues()
+
+        streamed = DataLoader(self.config_path, chunk_size=7)
+        streamed.load_and_process_issues()
+        pd.testing.assert_frame_equal(streamed.events_df, full.events_df)
+
+        jsonl_path = os.path.join(self.tmpdir.name, 'issues.jsonl')
+        self.write_json_lines(issues, jsonl_path)
+        sharded = DataLoader(file_path=jsonl_path, workers=3)
+        sharded.load_and_process_issues()
+        pd.testing.assert_frame_equal(sharded.events_df, full.events_df)
+
+    def test_incremental_update_naive_timestamps(self):
+        """Updated dates without an offset are compared as UTC, so unchanged issues are not reprocessed."""
+        issues = [dict(make_issue(n, 'open'), updated_date=f'2023-01-{n + 1:02d}T10:00:00') for n in range(10)]
+        self.write_issues(issues)
+        cache_dir = os.path.join(self.tmpdir.name, 'cache')
+        DataLoader(self.config_path, cache_dir=cache_dir).load_and_process_issues()
+
+        issues[3] = dict(make_issue(3, 'closed'), updated_date='2023-02-01T10:00:00')
+        self.write_issues(issues)
+
+        loader = DataLoader(self.config_path, cache_dir=cache_dir, incremental=True)
+        with patch.object(DataLoader, 'process_issues', wraps=loader.process_issues) as mock_process:
+            with patch('builtins.print'):
+                df = loader.load_and_process_issues()
+            processed = mock_process.call_args[0][0]
+        self.assertEqual(sorted(issue['number'] for issue in processed), [3, 9])
+        self.assertEqual(df.loc[df['number'] == 3, 'state'].item(), 'closed')
+
+    def test_events_table_cached_and_incremental(self):
+        issues = [dict(make_issue(n, 'open'), updated_date=f'2023-01-{n + 1:02d}T10:00:00+00:00') for n in range(10)]
+        self.write_issues(issues)
+        cache_dir = os.path.join(self.tmpdir.name, 'cache')
+        cold = DataLoader(self.config_path, cache_dir=cache_dir)
+        cold.load_and_process_issues()
+        warm = DataLoader(self.config_path, cache_dir=cache_dir)
+        warm.load_and_process_issues()
+        pd.testing.assert_frame_equal(warm.events_df, cold.events_df)
+
+        issues[3] = dict(make_issue(3, 'closed'), updated_date='2023-02-01T10:00:00+00:00')
+        self.write_issues(issues)
+        loader = DataLoader(self.config_path, cache_dir=cache_dir, incremental=True)
+        with patch('builtins.print'):
+            df = loader.load_and_process_issues()
+        self.check_events(loader, df, issues)
+        self.assertEqual(loader.events_df.loc[loader.events_df['issue_number'] == 3, 'event_type'].tolist(),
+                         ['labeled', 'closed'])
+
+    def test_events_table_multiple_repositories(self):
+        repos_dir = os.path.join(self.tmpdir.name, 'repos')
+        os.makedirs(repos_dir)
+        for name, count in [('poetry', 3), ('pip', 2)]:
+            with open(os.path.join(repos_dir, f'{name}.json'), 'w') as f:
+                json.dump([make_issue(n) for n in range(count)], f)
+        loader = DataLoader(file_path=os.path.join(repos_dir, '*.json'), workers=2)
+        loader.load_and_process_issues()
+        self.assertEqual(loader.events_df.groupby('repo').size().to_dict(), {'pip': 4, 'poetry': 6})
+
+    def test_parse_date_bound(self):
+        self.assertEqual(parse_date_bound('2024-03-01'), datetime(2024, 3, 1, tzinfo=timezone.utc))
+        self.assertEqual(parse_date_bound('2024-03-01T02:00:00+02:00'), datetime(2024, 3, 1, tzinfo=timezone.utc))
+        ago = datetime.now(timezone.utc) - parse_date_bound('90d')
+        self.assertAlmostEqual(ago.total_seconds(), timedelta(days=90).total_seconds(), delta=60)
+        self.assertIsNone(parse_date_bound(None))
+
+    def test_in_date_window(self):
+        since, until = parse_date_bound('2023-03-01'), parse_date_bound('2023-04-01')
+        self.assertTrue(in_date_window('2023-03-01T00:00:00+00:00', since, until))
+        self.assertFalse(in_date_window('2023-04-01T00:00:00Z', since, until))
+        self.assertFalse(in_date_window(None, since, until))
+        self.assertTrue(in_date_window(None, None, None))
+
+    def make_dated_issues(self):
+        return [dict(make_issue(n, 'closed' if n % 3 else 'open'), created_date=f'2023-{n % 12 + 1:02d}-10T10:00:00+00:00')
+                for n in range(48)]
+
+    def test_date_window(self):
+        """Every way of loading keeps the same issues and events inside [since, until)."""
+        self.check_date_window(self.make_dated_issues())
+
+    def test_date_window_naive_dates(self):
+        """Dates without an offset are taken as UTC both while parsing and when slicing the cache."""
+        issues = self.make_dated_issues()
+        for issue in issues:
+            issue['created_date'] = issue['created_date'][:19]
+        # Just before and at the exclusive end of the window
+        issues[2]['created_date'] = '2023-04-30T23:59:59'
+        issues[3]['created_date'] = '2023-05-01T00:00:00'
+        self.check_date_window(issues)
+
+    def check_date_window(self, issues):
+        expected = [issue for issue in issues if issue['created_date'][:7] in ('2023-03', '2023-04')]
+        self.write_issues(issues)
+        jsonl_path = os.path.join(self.tmpdir.name, 'issues.jsonl')
+        self.write_json_lines(issues, jsonl_path)
+        cache_dir = os.path.join(self.tmpdir.name, 'cache')
+
+        window = {'since': '2023-03-01', 'until': '2023-05-01'}
+        loaders = [
+            DataLoader(self.config_path, **window),
+            DataLoader(self.config_path, chunk_size=5, **window),
+            DataLoader(file_path=jsonl_path, **window),
+            DataLoader(file_path=jsonl_path, workers=3, **window),
+            DataLoader(self.config_path, cache_dir=cache_dir, **window),
+            DataLoader(self.config_path, cache_dir=cache_dir, **window),
+        ]
+        for loader in loaders:
+            df = loader.load_and_process_issues()
+            self.assertEqual(sorted(df['number']), [issue['number'] for issue in expected])
+            self.check_events(loader, df, expected)
+        # The cache still holds every issue
+        self.assertEqual(len(DataLoader(self.config_path, cache_dir=cache_dir).load_and_process_issues()), 48)
+
+    def test_date_window_skips_decoding_json_lines(self):
+        """Issues outside the window are recognised from the raw line and never decoded."""
+        jsonl_path = os.path.join(self.tmpdir.name, 'issues.jsonl')
+        self.write_json_lines(self.make_dated_issues(), jsonl_path)
+        loader = DataLoader(file_path=jsonl_path, since='2023-12-01')
+        with patch('data_loader.json.loads', wraps=json.loads) as loads:
+            issues = loader.load_issues()
+        self.assertEqual(len(issues), 4)
+        self.assertEqual(loads.call_count, 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
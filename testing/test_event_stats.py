@@ -0,0 +1,80 @@
+import unittest
+import pandas as pd
+from event_stats import EventStats, events_frame, events_from_issues, resolve_closing_events
+from model import Issue
+
+
+class TestEventStats(unittest.TestCase):
+
+    def setUp(self):
+        self.issues_df = pd.DataFrame({
+            'number': [1, 2, 3],
+            'creator': ['user1', 'user2', 'user1'],
+            'events': [
+                [{'event_type': 'labeled', 'author': 'user1'},
+                 {'event_type': 'closed', 'author': 'maintainer'}],
+                [],
+                [{'event_type': 'commented', 'author': 'user1'}],
+            ],
+        })
+
+    def test_events_from_issues(self):
+        events_df = events_from_issues(self.issues_df)
+        self.assertEqual(events_df['issue_number'].tolist(), [1, 1, 3])
+        self.assertEqual(events_df['event_type'].tolist(), ['labeled', 'closed', 'commented'])
+
+    def test_events_table_columns(self):
+        events_df = events_from_issues(self.issues_df.assign(events=[
+            [{'event_type': 'labeled', 'author': 'user1', 'label': 'kind/bug', 'event_date': '2023-01-01T10:00:00+00:00'}],
+            None,
+            [{'event_type': 'closed', 'author': 'maintainer', 'event_date': 'not a date'}],
+        ]))
+        self.assertEqual(list(events_df.columns), ['issue_number', 'event_type', 'author', 'event_date', 'label'])
+        self.assertEqual(events_df['event_date'].iloc[0], pd.Timestamp('2023-01-01T10:00:00', tz='UTC'))
+        self.assertTrue(pd.isna(events_df['event_date'].iloc[1]))
+        self.assertEqual(events_df['label'].iloc[0], 'kind/bug')
+        self.assertTrue(pd.isna(events_df['label'].iloc[1]))
+
+    def test_prebuilt_events_table(self):
+        stats = EventStats.from_issues(self.issues_df.drop(columns=['events']), events_from_issues(self.issues_df))
+        self.assertEqual(stats.total(), 3)
+
+    def test_resolve_closing_events(self):
+        events_df = events_frame([
+            [{'event_type': 'closed', 'author': 'a', 'event_date': '2023-01-02T00:00:00Z'},
+             {'event_type': 'commented', 'author': 'b', 'event_date': '2023-01-03T00:00:00Z'},
+             {'event_type': 'reopened', 'author': 'b', 'event_date': '2023-01-04T00:00:00Z'},
+             {'event_type': 'closed', 'author': 'c', 'event_date': '2023-01-06T00:00:00Z'}],
+            [{'event_type': 'labeled', 'author': 'a', 'event_date': '2023-01-02T00:00:00Z'}],
+            [{'event_type': 'closed', 'author': 'a', 'event_date': '2023-01-02T00:00:00Z'},
+             {'event_type': 'reopened', 'author': 'b', 'event_date': '2023-01-03T00:00:00Z'}],
+        ], [10, 11, 12], index=[0, 1, 2])
+        resolved = resolve_closing_events(events_df)
+        self.assertEqual(resolved.index.tolist(), [0, 2])
+        self.assertEqual(resolved.loc[0, 'closed_by'], 'c')
+        self.assertEqual(resolved.loc[0, 'closed_at'], pd.Timestamp('2023-01-06', tz='UTC'))
+        self.assertEqual(resolved.loc[0, 'closed_time'], pd.Timedelta(days=2))
+        self.assertTrue(pd.isna(resolved.loc[2, 'closed_at']))
+        self.assertEqual(resolved['reopen_count'].tolist(), [1, 1])
+
+    def test_no_events_column(self):
+        stats = EventStats.from_issues(self.issues_df.drop(columns=['events']))
+        self.assertEqual(stats.total(), 0)
+        self.assertTrue(stats.per_author().empty)
+
+    def test_counts_match_issue_model(self):
+        """Counts agree with building Issue objects row by row."""
+        issues = [Issue(row.to_dict()) for _, row in self.issues_df.iterrows()]
+        stats = EventStats.from_issues(self.issues_df)
+        self.assertEqual(stats.total(), sum(len(issue.events) for issue in issues))
+        self.assertEqual(stats.total(author='user1'),
+                         sum(1 for issue in issues for e in issue.events if e.author == 'user1'))
+
+    def test_per_author_and_type(self):
+        stats = EventStats.from_issues(self.issues_df)
+        self.assertEqual(stats.per_author().to_dict(), {'user1': 2, 'maintainer': 1})
+        self.assertEqual(stats.per_type()['closed'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
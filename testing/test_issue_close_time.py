@@ -1,7 +1,8 @@
 import unittest
 from unittest.mock import patch, MagicMock
 import pandas as pd
-from issue_close_time_analysis import IssueCloseTimeAnalysis
+from issue_close_time_analysis import IssueCloseTimeAnalysis, label_close_time_stats
+from label_index import LabelIndex
 import subprocess
 
 
@@ -119,6 +120,22 @@ class TestIssueCloseTimeAnalysis(unittest.TestCase):
         # Run the coverage report for issue_close_time_analysis.py
         get_specific_coverage_report('issue_close_time_analysis.py')
 
+    def test_label_close_time_stats(self):
+        """Count, mean, median and p90 are computed per label in one pass."""
+        closed_issues_df = pd.DataFrame({
+            'created_at': pd.to_datetime(['2024-01-01'] * 4),
+            'closed_at': pd.to_datetime(['2024-01-02', '2024-01-03', '2024-01-11', '2024-01-05']),
+            'labels': [['bug'], ['bug'], ['bug', 'feature'], ['feature']]
+        })
+        close_time = closed_issues_df['closed_at'] - closed_issues_df['created_at']
+        stats = label_close_time_stats(close_time, LabelIndex.from_issues(closed_issues_df))
+
+        self.assertEqual(stats.loc['bug', 'count'], 3)
+        self.assertEqual(stats.loc['bug', 'mean'], pd.Timedelta(days=13 / 3))
+        self.assertEqual(stats.loc['bug', 'median'], pd.Timedelta(days=2))
+        self.assertEqual(stats.loc['bug', 'p90'], pd.Timedelta(days=8.4))
+        self.assertEqual(stats.loc['feature', 'median'], pd.Timedelta(days=7))
+
 
 if __name__ == '__main__':
     unittest.main()
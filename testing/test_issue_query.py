@@ -0,0 +1,118 @@
+import unittest
+import numpy as np
+import pandas as pd
+from analysis import Analysis
+from issue_query import ColumnIndex, IssueQuery, SortedIndex, to_timestamp
+from issue_store import IssueStore
+from label_index import LabelIndex
+
+
+class TestIssueQuery(unittest.TestCase):
+
+    def setUp(self):
+        self.df = pd.DataFrame({
+            'creator': ['dbrtly', 'srittau', 'dbrtly', 'radoering', None],
+            'labels': [['kind/bug', 'status/triage'], ['area/docs'], [], ['kind/bug'], ['kind/bug']],
+            'state': ['closed', 'open', 'closed', 'closed', 'open'],
+            'closed_by': ['radoering', None, 'secrus', 'radoering', None],
+            'created_at': pd.to_datetime(['2024-01-05', '2024-02-10', '2024-03-15', '2024-04-20', '2024-05-25'],
+                                         utc=True),
+        }, index=[10, 11, 12, 13, 14])
+        self.label_index = LabelIndex.from_issues(self.df)
+
+    def test_no_predicates(self):
+        query = IssueQuery(self.df)
+        np.testing.assert_array_equal(query.positions(), [0, 1, 2, 3, 4])
+        self.assertEqual(query.count(), 5)
+
+    def test_label_and_creator(self):
+        query = IssueQuery(self.df, self.label_index).label('kind/bug').creator('dbrtly')
+        np.testing.assert_array_equal(query.positions(), [0])
+        self.assertEqual(list(query.issues().index), [10])
+
+    def test_label_without_index(self):
+        """Scanning the labels column gives the same positions as the label index."""
+        np.testing.assert_array_equal(IssueQuery(self.df).label('kind/bug').positions(),
+                                      IssueQuery(self.df, self.label_index).label('kind/bug').positions())
+
+    def test_state_and_closed_by_are_normalized(self):
+        query = IssueQuery(self.df).state(' Closed ').closed_by('RADOERING')
+        np.testing.assert_array_equal(query.positions(), [0, 3])
+
+    def test_unknown_value(self):
+        self.assertEqual(IssueQuery(self.df).creator('nobody').count(), 0)
+        self.assertEqual(IssueQuery(self.df, self.label_index).label('unknown').count(), 0)
+
+    def test_between(self):
+        query = IssueQuery(self.df).between('2024-02-10', '2024-04-20')
+        np.testing.assert_array_equal(query.positions(), [1, 2])
+        np.testing.assert_array_equal(IssueQuery(self.df).between(since='2024-04-01').positions(), [3, 4])
+        np.testing.assert_array_equal(IssueQuery(self.df).between(until='2024-01-06').positions(), [0])
+
+    def test_between_after_indexed_predicates(self):
+        query = IssueQuery(self.df, self.label_index).label('kind/bug').between(since='2024-03-01')
+        np.testing.assert_array_equal(query.positions(), [3, 4])
+
+    def test_to_timestamp(self):
+        aware = self.df['created_at']
+        naive = aware.dt.tz_localize(None)
+        self.assertEqual(to_timestamp('2024-01-01', aware), pd.Timestamp('2024-01-01', tz='UTC'))
+        self.assertEqual(to_timestamp('2024-01-01T02:00:00+02:00', aware), pd.Timestamp('2024-01-01', tz='UTC'))
+        self.assertEqual(to_timestamp('2024-01-01T02:00:00+02:00', naive), pd.Timestamp('2024-01-01'))
+
+    def test_queries_are_immutable_and_share_indexes(self):
+        base = IssueQuery(self.df)
+        by_creator = base.creator('dbrtly')
+        self.assertEqual(base.count(), 5)
+        self.assertEqual(by_creator.count(), 2)
+        self.assertIn('creator', base.indexes)
+        self.assertIs(base.column_index('creator'), by_creator.column_index('creator'))
+
+    def test_sorted_index(self):
+        created_at = self.df['created_at'].iloc[[3, 0, 4, 1, 2]]
+        index = SortedIndex(created_at)
+        np.testing.assert_array_equal(index.positions('2024-02-10', '2024-04-20'), [3, 4])
+        np.testing.assert_array_equal(index.positions(until='2024-01-06'), [1])
+        self.assertEqual(len(index.positions('2024-04-01', '2024-03-01')), 0)
+
+    def test_sorted_index_naive_column(self):
+        """A naive column is compared in UTC, as the DataLoader treats dates without an offset."""
+        index = SortedIndex(self.df['created_at'].dt.tz_localize(None))
+        np.testing.assert_array_equal(index.positions('2024-02-10T02:00:00+02:00', '2024-04-20'), [1, 2])
+        np.testing.assert_array_equal(index.positions(pd.Timestamp('2024-03-15', tz='UTC')), [2, 3, 4])
+
+    def test_between_uses_sorted_index(self):
+        query = IssueQuery(self.df).between('2024-02-10')
+        np.testing.assert_array_equal(query.positions(), [1, 2, 3, 4])
+        self.assertIn('created_at:sorted', query.indexes)
+
+    def test_column_index_skips_missing_values(self):
+        index = ColumnIndex(self.df['creator'])
+        np.testing.assert_array_equal(index.positions('dbrtly'), [0, 2])
+        self.assertEqual(len(index.positions(None)), 0)
+
+    def test_explode_matches_filtering_the_exploded_frame(self):
+        """Exploding only the matches gives the rows the exploded whole frame is filtered to."""
+        exploded = self.df.explode('labels')
+        expected = exploded[(exploded['labels'] == 'kind/bug') & (exploded['state'] == 'closed')]
+        actual = IssueQuery(self.df, self.label_index).label('kind/bug').state('closed').explode()
+        pd.testing.assert_frame_equal(actual, expected)
+
+        expected = exploded[exploded['creator'] == 'dbrtly']
+        pd.testing.assert_frame_equal(IssueQuery(self.df).creator('dbrtly').explode(), expected)
+
+    def test_filter_issues_predicates(self):
+        analysis = Analysis()
+        filtered_df = analysis.filter_issues(self.df, label='kind/bug', closed_by='radoering', since='2024-02-01')
+        self.assertEqual(list(filtered_df.index), [13])
+        self.assertEqual(filtered_df.iloc[0]['labels'], 'kind/bug')
+
+    def test_store_query(self):
+        store = IssueStore.from_issues(self.df)
+        self.assertEqual(store.query().label('kind/bug').state('open').count(), 1)
+        store.query().creator('dbrtly').count()
+        self.assertIn('creator', store.query().indexes)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+from unittest.mock import MagicMock, patch
+import pandas as pd
+from issue_store import IssueStore
+from month_issue_analysis import MonthIssueAnalysis
+
+
+class TestIssueStore(unittest.TestCase):
+
+    def setUp(self):
+        self.mock_df = pd.DataFrame({
+            'created_at': [pd.Timestamp('2023-01-15'), pd.Timestamp('2023-02-20')],
+            'closed_at': [pd.Timestamp('2023-01-25'), pd.Timestamp('2023-03-10')],
+            'state': ['closed', 'closed']
+        })
+        self.mock_loader = MagicMock()
+        self.mock_loader.load_and_process_issues.return_value = self.mock_df
+
+    def test_loads_once(self):
+        """Repeated access returns the same frame from a single load."""
+        store = IssueStore(self.mock_loader)
+        first = store.get_issues()
+        second = store.get_issues()
+        self.assertIs(first, second)
+        self.mock_loader.load_and_process_issues.assert_called_once()
+
+    def test_clear_reloads(self):
+        store = IssueStore(self.mock_loader)
+        store.get_issues()
+        store.clear()
+        store.get_issues()
+        self.assertEqual(self.mock_loader.load_and_process_issues.call_count, 2)
+
+    def test_by_repo(self):
+        """Each repository gets a store with only its own issues."""
+        df = self.mock_df.assign(repo=['pip', 'poetry'])
+        repos = {repo: store.get_issues() for repo, store in IssueStore.from_issues(df).by_repo()}
+        self.assertEqual(sorted(repos), ['pip', 'poetry'])
+        self.assertEqual(len(repos['pip']), 1)
+
+    def test_events_from_loader(self):
+        """The store hands out the events table built by the loader in the same load."""
+        events_df = pd.DataFrame({'issue_number': [1, 1], 'event_type': ['labeled', 'closed']})
+        self.mock_loader.events_df = events_df
+        store = IssueStore(self.mock_loader)
+        self.assertIs(store.get_events(), events_df)
+        self.mock_loader.load_and_process_issues.assert_called_once()
+
+    def test_by_repo_splits_events(self):
+        df = self.mock_df.assign(repo=['pip', 'poetry'], number=[1, 1])
+        events_df = pd.DataFrame({'issue_number': [1, 1, 1], 'event_type': ['closed', 'labeled', 'closed'],
+                                  'repo': ['pip', 'poetry', 'poetry']})
+        repos = {repo: store.get_events() for repo, store in IssueStore.from_issues(df, events_df).by_repo()}
+        self.assertEqual(repos['pip']['event_type'].tolist(), ['closed'])
+        self.assertEqual(repos['poetry']['event_type'].tolist(), ['labeled', 'closed'])
+
+    def test_by_repo_single_repository(self):
+        store = IssueStore(self.mock_loader)
+        self.assertEqual(list(store.by_repo()), [(None, store)])
+
+    @patch('month_issue_analysis.DataLoader')
+    def test_analysis_uses_passed_frame(self, MockDataLoader):
+        """An analysis given a preloaded frame does not load the data again."""
+        store = IssueStore(self.mock_loader)
+        with patch('matplotlib.pyplot.show'):
+            MonthIssueAnalysis().run(store.get_issues())
+        MockDataLoader.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
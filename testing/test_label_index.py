@@ -0,0 +1,50 @@
+import unittest
+import numpy as np
+import pandas as pd
+from analysis import Analysis
+from label_index import LabelIndex
+
+
+class TestLabelIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.df = pd.DataFrame({
+            'creator': ['dbrtly', 'srittau', 'dbrtly', 'radoering'],
+            'labels': [['kind/bug', 'status/triage'], ['area/docs'], [], ['kind/bug']],
+            'days': [5, 3, 1, 7],
+        }, index=[10, 11, 12, 13])
+        self.index = LabelIndex.from_issues(self.df)
+
+    def test_positions(self):
+        np.testing.assert_array_equal(self.index.positions('kind/bug'), [0, 3])
+        np.testing.assert_array_equal(self.index.positions('area/docs'), [1])
+        self.assertEqual(len(self.index.positions('unknown')), 0)
+
+    def test_counts(self):
+        self.assertEqual(self.index.counts().to_dict(), {'kind/bug': 2, 'area/docs': 1, 'status/triage': 1})
+
+    def test_matrix(self):
+        matrix = self.index.matrix()
+        self.assertEqual(list(matrix.index), [10, 11, 12, 13])
+        self.assertEqual(matrix['kind/bug'].tolist(), [True, False, False, True])
+        self.assertFalse(matrix.loc[12].any())
+
+    def test_subset(self):
+        subset = self.index.subset(np.array([False, True, True, True]))
+        np.testing.assert_array_equal(subset.positions('kind/bug'), [2])
+        self.assertEqual(len(subset.positions('status/triage')), 0)
+
+    def test_aggregate(self):
+        means = self.index.aggregate(self.df['days'], 'mean')
+        self.assertEqual(means.to_dict(), {'area/docs': 3.0, 'kind/bug': 6.0, 'status/triage': 5.0})
+
+    def test_filter_issues_with_index(self):
+        """Filtering through the index gives the same rows as exploding the whole frame."""
+        analysis = Analysis()
+        expected = analysis.filter_issues(self.df, label='kind/bug', creator='dbrtly')
+        actual = analysis.filter_issues(self.df, label='kind/bug', creator='dbrtly', label_index=self.index)
+        pd.testing.assert_frame_equal(actual, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+from datetime import datetime, timezone
+from dateutil import parser
+from unittest.mock import patch
+from model import Event, EventList, Issue, parse_date
+
+
+class TestModel(unittest.TestCase):
+
+    def test_parse_date_iso(self):
+        """GitHub timestamps parse to the same value as with dateutil."""
+        for value in ['2024-10-14T10:03:29+00:00', '2024-10-14T10:03:29Z', '2024-10-14']:
+            self.assertEqual(parse_date(value), parser.parse(value))
+
+    def test_parse_date_fallback(self):
+        """Non-ISO dates still parse through dateutil."""
+        self.assertEqual(parse_date('Oct 14 2024 10:03'), datetime(2024, 10, 14, 10, 3))
+        with self.assertRaises((ValueError, TypeError)):
+            parse_date('not a date')
+
+    def test_event_dates(self):
+        event = Event({'event_type': 'closed', 'author': 'user1', 'event_date': '2024-10-14T10:03:29+00:00'})
+        self.assertEqual(event.event_date, datetime(2024, 10, 14, 10, 3, 29, tzinfo=timezone.utc))
+        self.assertIsNone(Event({'event_type': 'closed', 'event_date': None}).event_date)
+
+    def test_issue_dates(self):
+        issue = Issue({'number': '7', 'state': 'open', 'created_date': '2024-10-14T10:03:29+00:00',
+                       'updated_date': 'garbage'})
+        self.assertEqual(issue.number, 7)
+        self.assertEqual(issue.created_date.year, 2024)
+        self.assertIsNone(issue.updated_date)
+
+    def test_events_parsed_lazily(self):
+        """Counting events does not build Event objects."""
+        raw_events = [{'event_type': 'labeled', 'author': 'user1', 'event_date': '2024-10-14T10:03:29+00:00'},
+                      {'event_type': 'closed', 'author': 'user2', 'event_date': '2024-10-15T10:03:29+00:00'}]
+        with patch('model.Event.from_json') as mock_from_json:
+            issue = Issue({'number': 1, 'events': raw_events})
+            self.assertEqual(len(issue.events), 2)
+            mock_from_json.assert_not_called()
+
+        issue = Issue({'number': 1, 'events': raw_events})
+        self.assertIsInstance(issue.events, EventList)
+        self.assertEqual([e.author for e in issue.events], ['user1', 'user2'])
+        self.assertIs(issue.events[1], issue.events[-1])
+        self.assertEqual(issue.events[:1][0].event_type, 'labeled')
+
+    def test_compact_instances(self):
+        """Issues and events have no per-instance __dict__ and share repeated strings."""
+        first = Issue({'creator': ''.join(['us', 'er1']), 'labels': ['kind/bug']})
+        second = Issue({'creator': ''.join(['use', 'r1']), 'labels': ['kind/bug']})
+        self.assertFalse(hasattr(first, '__dict__'))
+        self.assertFalse(hasattr(Event(None), '__dict__'))
+        self.assertIs(first.creator, second.creator)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,6 @@
 import unittest
 from unittest.mock import MagicMock, patch
-from overall_analysis import OverallAnalysis
+from overall_analysis import OverallAnalysis, resolution_times, resolution_time_stats
 from data_loader import DataLoader
 import pandas as pd
 from datetime import datetime
@@ -113,6 +113,21 @@ class TestOverallAnalysis(unittest.TestCase):
             with self.assertRaises(KeyError):
                 self.analysis.run()
 
+    def test_resolution_times(self):
+        """Resolution times are computed as one column for closed issues only."""
+        self.assertEqual(resolution_times(self.mock_issues).tolist(), [9, 14])
+
+    def test_resolution_time_stats(self):
+        stats = resolution_time_stats(pd.Series(range(1, 101)), bins=10)
+        self.assertEqual(stats['count'], 100)
+        self.assertAlmostEqual(stats['mean'], 50.5)
+        self.assertAlmostEqual(stats['p50'], 50.5)
+        self.assertAlmostEqual(stats['p90'], 90.1)
+        self.assertAlmostEqual(stats['p99'], 99.01)
+        counts, edges = stats['histogram']
+        self.assertEqual(counts.tolist(), [10] * 10)
+        self.assertEqual(len(edges), 11)
+
     def tearDown(self):
         """Clean up after each test."""
         self.analysis = None
@@ -0,0 +1,44 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+import matplotlib.pyplot as plt
+import plotting
+
+
+class TestPlotting(unittest.TestCase):
+
+    def tearDown(self):
+        plotting.finish()
+
+    def test_show_interactive_by_default(self):
+        plotting.configure()
+        with patch('matplotlib.pyplot.show') as mock_show:
+            plotting.show('figure')
+            mock_show.assert_called_once()
+
+    def test_headless_renders_files(self):
+        """Figures are saved to the output directory by the worker processes."""
+        with tempfile.TemporaryDirectory() as output_dir:
+            plotting.configure(output_dir, 'svg', workers=2)
+            for name in ['first chart', 'second/chart']:
+                plt.figure()
+                plt.bar(['a', 'b'], [1, 2])
+                with patch('matplotlib.pyplot.show') as mock_show:
+                    plotting.show(name)
+                    mock_show.assert_not_called()
+            paths = plotting.finish()
+
+            self.assertEqual([os.path.basename(path) for path in paths],
+                             ['01_first_chart.svg', '02_second_chart.svg'])
+            for path in paths:
+                self.assertGreater(os.path.getsize(path), 0)
+
+    def test_unsupported_format(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            with self.assertRaises(ValueError):
+                plotting.configure(output_dir, 'bmp')
+
+
+if __name__ == '__main__':
+    unittest.main()
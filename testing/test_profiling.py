@@ -0,0 +1,62 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+import profiling
+
+
+class TestProfiling(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.report_path = os.path.join(self.tmpdir.name, 'profile.json')
+
+    def tearDown(self):
+        profiling.finish()
+        self.tmpdir.cleanup()
+
+    def test_disabled_records_nothing(self):
+        @profiling.timed('work')
+        def work():
+            return 42
+
+        self.assertEqual(work(), 42)
+        self.assertEqual(profiling.report()['stages'], {})
+        self.assertIsNone(profiling.finish())
+
+    def test_nested_stages_report(self):
+        """Nested stages are aggregated under '/'-joined names and written as JSON."""
+        profiling.configure(enabled=True, report_path=self.report_path)
+
+        @profiling.timed('process')
+        def process():
+            return sum(range(1000))
+
+        with profiling.stage('load'):
+            process()
+            process()
+        profiling.annotate('issues', 2)
+
+        self.assertEqual(profiling.finish(), self.report_path)
+        with open(self.report_path) as f:
+            report = json.load(f)
+        self.assertEqual(report['issues'], 2)
+        self.assertEqual(list(report['stages']), ['load/process', 'load'])
+        self.assertEqual(report['stages']['load/process']['calls'], 2)
+        self.assertGreaterEqual(report['stages']['load']['seconds'], report['stages']['load/process']['seconds'])
+        self.assertFalse(profiling.is_enabled())
+
+    def test_cprofile_statistics(self):
+        profiling.configure(report_path=self.report_path, cprofile=True)
+        with profiling.stage('work'):
+            sorted(range(1000), reverse=True)
+        with redirect_stdout(io.StringIO()):
+            profiling.finish()
+        self.assertTrue(os.path.exists(os.path.join(self.tmpdir.name, 'profile.prof')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+import os
+import json
+import subprocess
+import sys
+import tempfile
+import unittest
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+HEAVY_MODULES = ['pandas', 'numpy', 'matplotlib', 'seaborn', 'dateutil']
+# Time the imports of run.py may add to a bare interpreter start, in milliseconds
+IMPORT_BUDGET_MS = 100
+
+
+def import_times(*args):
+    """
+    Runs python -X importtime with the given arguments and returns the
+    cumulative import time in microseconds of every top-level import.
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime', *args], cwd=ROOT_DIR,
+                            capture_output=True, text=True, timeout=60)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        times[name.strip()] = int(cumulative)
+        if not name.startswith('  '):
+            times.setdefault('<top-level>', 0)
+            times['<top-level>'] += int(cumulative)
+    return times
+
+
+class TestRunStartup(unittest.TestCase):
+
+    def check_startup(self, *args):
+        times = import_times('run.py', *args)
+        for module in HEAVY_MODULES:
+            self.assertNotIn(module, times, f'run.py {" ".join(args)} imported {module}')
+
+        baseline = import_times('-c', 'pass')['<top-level>']
+        self.assertLess((times['<top-level>'] - baseline) / 1000, IMPORT_BUDGET_MS)
+
+    def test_help_is_fast(self):
+        self.check_startup('--help')
+
+    def test_missing_user_and_label_is_fast(self):
+        """Feature 1 without --user or --label is rejected before any data library is imported."""
+        self.check_startup('--feature', '1')
+
+    def test_unknown_feature_is_fast(self):
+        self.check_startup('--feature', '7')
+
+    def test_invalid_date_is_usage_error(self):
+        """A malformed --since or --until is rejected by the argument parser before anything is loaded."""
+        for flag, value in [('--since', 'yesterday-ish'), ('--until', '2023-13-45')]:
+            result = subprocess.run([sys.executable, 'run.py', '--feature', '0', flag, value], cwd=ROOT_DIR,
+                                    capture_output=True, text=True, timeout=60)
+            self.assertEqual(result.returncode, 2)
+            self.assertIn(f"argument {flag}: invalid date: '{value}'", result.stderr)
+
+
+class TestRunUsers(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        issues = [{
+            'url': f'https://github.com/python-poetry/poetry/issues/{number}',
+            'creator': f'user{number % 3}',
+            'labels': ['kind/bug'],
+            'state': 'closed',
+            'title': f'Issue {number}',
+            'text': '',
+            'number': number,
+            'created_date': f'2023-0{number % 9 + 1}-01T10:00:00+00:00',
+            'updated_date': '2023-10-01T10:00:00+00:00',
+            'events': [{'event_type': 'closed', 'author': f'user{number % 2}',
+                        'event_date': '2023-10-01T10:00:00+00:00'}],
+        } for number in range(12)]
+        data_path = os.path.join(self.tmpdir.name, 'issues.json')
+        with open(data_path, 'w') as f:
+            json.dump(issues, f)
+        with open(os.path.join(self.tmpdir.name, 'config.json'), 'w') as f:
+            json.dump({'file_path': data_path}, f)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def run_features(self, *args):
+        env = dict(os.environ, MPLBACKEND='Agg')
+        result = subprocess.run([sys.executable, os.path.join(ROOT_DIR, 'run.py'), *args,
+                                 '--output-dir', os.path.join(self.tmpdir.name, 'figures')],
+                                cwd=self.tmpdir.name, env=env, capture_output=True, text=True, timeout=120)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        return result.stdout
+
+    def test_user_list_with_several_features(self):
+        """A list of users gets one report each in feature 1 and is not taken as one name by the others."""
+        output = self.run_features('--feature', '1,2', '--user', 'user1,user2')
+        self.assertIn('===== User user1 =====', output)
+        self.assertIn('===== User user2 =====', output)
+        self.assertIn('Found 12 events across 12 issues.', output)
+        self.assertNotIn('user1,user2', output)
+
+    def test_single_user_with_several_features(self):
+        output = self.run_features('--feature', '1,2', '--user', 'user1')
+        self.assertIn('Found 6 events across 12 issues for user1.', output)
+
+
+if __name__ == '__main__':
+    unittest.main()
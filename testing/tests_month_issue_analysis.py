@@ -1,7 +1,7 @@
 import unittest
 from unittest.mock import patch, MagicMock
 import pandas as pd
-from month_issue_analysis import MonthIssueAnalysis
+from month_issue_analysis import MonthIssueAnalysis, monthly_issue_counts
 
 class TestMonthIssueAnalysis(unittest.TestCase):
 
@@ -104,7 +104,46 @@ class TestMonthIssueAnalysis(unittest.TestCase):
         
         with self.assertRaises(ValueError):  # Expecting a ValueError due to invalid date parsing
             analysis.run()
-   
+
+    def test_monthly_issue_counts(self):
+        """Counts per calendar month merge all years into 12 buckets."""
+        data = {
+            'created_at': pd.to_datetime(['2022-01-15', '2023-01-20', '2023-03-01']),
+            'closed_at': pd.to_datetime(['2022-02-01', None, '2023-03-05']),
+            'state': ['closed', 'open', 'closed']
+        }
+        counts = monthly_issue_counts(pd.DataFrame(data))
+        self.assertEqual(list(counts.index), list(range(1, 13)))
+        self.assertEqual(counts.loc[1, 'opened'], 2)
+        self.assertEqual(counts.loc[2, 'closed'], 1)
+        self.assertEqual(counts['closed'].sum(), 2)
+
+    def test_year_month_counts(self):
+        """The year-month series keeps years apart and fills empty months."""
+        data = {
+            'created_at': pd.to_datetime(['2022-11-15', '2023-01-20'], utc=True),
+            'closed_at': pd.to_datetime(['2023-01-25', None], utc=True),
+            'state': ['closed', 'open']
+        }
+        counts = monthly_issue_counts(pd.DataFrame(data), 'year-month')
+        self.assertEqual([str(p) for p in counts.index], ['2022-11', '2022-12', '2023-01'])
+        self.assertEqual(counts['opened'].tolist(), [1, 0, 1])
+        self.assertEqual(counts['closed'].tolist(), [0, 0, 1])
+
+    @patch('month_issue_analysis.DataLoader')
+    def test_year_month_plot(self, MockDataLoader):
+        data = {
+            'created_at': [pd.Timestamp('2023-01-15'), pd.Timestamp('2024-02-20')],
+            'closed_at': [pd.Timestamp('2023-01-25'), pd.Timestamp('2024-03-10')],
+            'state': ['closed', 'closed']
+        }
+        MockDataLoader.return_value.load_and_process_issues.return_value = pd.DataFrame(data)
+
+        analysis = MonthIssueAnalysis()
+        analysis.PERIOD = 'year-month'
+        with patch('matplotlib.pyplot.show') as mock_show:
+            analysis.run()
+            mock_show.assert_called_once()
 
 
 if __name__ == '__main__':